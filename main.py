@@ -8,18 +8,70 @@ Python Backend with PyWebview - IMPROVED VERSION
 import sys
 import os
 import json
+import functools
+from collections import OrderedDict
 import sqlite3
 import re
 import subprocess
 import platform
+import time
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 from pathlib import Path
 
+# Debug çıktıları sadece CORE_DEBUG ortam değişkeni ile aktif
+# (happy path'te print/format maliyeti ödenmesin)
+DEBUG = bool(os.environ.get('CORE_DEBUG'))
+
+# Modül adından cm cinsinden genişlik yakalayan desen ("Alt dolap 60 cm")
+_CM_RE = re.compile(r'(\d+)\s*cm')
+
+# Kanal bilgisi deseni ("SOL_13+9" gibi) - metin TR_FOLD ile katlandığı
+# için SAĞ/SAG ayrımı gerekmez
+_KANAL_RE = re.compile(r'(?:SOL|SAG)_\d+\+\d+')
+
+# Türkçe karakterleri ASCII karşılıklarına katlayan çeviri tablosu -
+# 'üst|ust' gibi regex alternasyonları yerine tek geçişli translate
+TR_FOLD = str.maketrans('üöışğçÜÖİŞĞÇ', 'uoisgcUOISGC')
+
+# Çıktı tablolarında parça tipi sıralaması - aynı tipler alt alta gelsin
+PART_TYPE_ORDER = [
+    'YAN', 'YAN (K)',
+    'ALT-ÜST', 'ALT-ÜST (K)',
+    'SABİT', 'SABİT (K)',
+    'RAF', 'RAF (K)',
+    'RAF (ÜST)', 'RAF (ÜST) (K)',
+    'KAYIT/KUŞAK', 'KAYIT/KUŞAK (K)',
+    'ÇEKMECE YANI', 'ÇEKMECE YANI (K)',
+    'ARKALIK', 'ARKALIK (K)',
+    'ARKALIK (İÇERDE)', 'ARKALIK (İÇERDE) (K)',
+    'DİĞER', 'DİĞER (K)'
+]
+# Sıra numarası sözlüğü - sort anahtarı O(N) list.index taraması yerine
+# O(1) hash araması yapsın
+_PART_TYPE_RANK = {name: i for i, name in enumerate(PART_TYPE_ORDER)}
+
+# Sütun mapping heuristiğinin tanıdığı başlık adları - döngü içinde her
+# seferinde liste kurmak yerine modül seviyesinde sabit kümeler
+_POZ_NAMES = frozenset(['poz', 'poz no', 'poz numarası'])
+_MODUL_NAMES = frozenset(['modül', 'modul', 'modül adı', 'modul adi'])
+_ADET_NAMES = frozenset(['adet', 'miktar', 'qty', 'quantity', 'sipariş', 'siparis', 'siparış'])
+_OLCU1_NAMES = frozenset(['uzunluk', 'boy', 'length', 'ölçü 1', 'olcu 1'])
+_OLCU2_NAMES = frozenset(['genişlik', 'genislik', 'en', 'width', 'ölçü 2', 'olcu 2'])
+_KANALLI_NAMES = frozenset(['kanallı', 'kanalli', 'kanal'])
+_MALZEME_NAMES = frozenset(['malzeme', 'malzeme kodu', 'material', 'malzeme adı'])
+
+# Sürükle-bırakta kabul edilen dosya uzantıları
+_ALLOWED_EXTS = frozenset(['.xlsx', '.xls', '.csv'])
+
 # ============================================================
 # FROZEN/EXE PATH FIX
 # ============================================================
 
+@functools.lru_cache(maxsize=1)
 def get_base_path() -> Path:
     """Get base path for resources (works for both dev and frozen exe)"""
     if getattr(sys, 'frozen', False):
@@ -27,6 +79,7 @@ def get_base_path() -> Path:
         return Path(sys._MEIPASS)
     return Path(__file__).parent
 
+@functools.lru_cache(maxsize=1)
 def get_app_dir() -> Path:
     """Get application directory (for data storage)"""
     if getattr(sys, 'frozen', False):
@@ -49,7 +102,13 @@ except ImportError:
 # Excel processing
 try:
     import pandas as pd
+    import numpy as np
     PANDAS_AVAILABLE = True
+    # determine_part_type kurallarındaki sabit derinlik merdivenleri -
+    # broadcast karşılaştırması için tek seferlik diziler
+    ALTUST_DEPTHS = np.array([579, 329, 549, 529, 559], dtype=np.int32)
+    RAF_DEPTHS_ALT = np.array([530, 520, 510, 500, 480, 450], dtype=np.int32)  # Derinlik-50
+    RAF_DEPTHS_UST = np.array([290, 280, 270, 260], dtype=np.int32)  # Derinlik-40
 except ImportError:
     PANDAS_AVAILABLE = False
     print("Warning: pandas not available")
@@ -65,6 +124,27 @@ except ImportError:
 #     REPORTLAB_AVAILABLE = False
 REPORTLAB_AVAILABLE = False
 
+# Polars / PyArrow / XlsxWriter - isteğe bağlı hızlandırıcılar. Flag'ler
+# find_spec ile kurulum kontrolü yapar, modülün kendisi ilk kullanımda
+# import edilir; açılışta bu ağır paketlerin yükleme bedeli ödenmez
+import importlib.util
+
+# Polars - çok çekirdekli CSV okuyucu
+POLARS_AVAILABLE = importlib.util.find_spec('polars') is not None
+
+# PyArrow - Arrow destekli string dtype için (pandas dtype yolu import eder)
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# XlsxWriter - hızlı akışlı xlsx yazıcı (export için)
+XLSXWRITER_AVAILABLE = importlib.util.find_spec('xlsxwriter') is not None
+
+# orjson - isteğe bağlı, C hızında JSON (yedekleme için)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # PyWebview
 try:
     import webview
@@ -74,6 +154,19 @@ except ImportError:
     print("Error: pywebview not available. Install with: pip install pywebview")
     sys.exit(1)
 
+# Geçmiş kayıtlarının body/thin blokları için JSON yardımcıları - orjson
+# kuruluysa C hızında serileştirme, yoksa stdlib (çıktılar birbirinin
+# yerine geçer)
+if ORJSON_AVAILABLE:
+    def _history_dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    def _history_loads(text):
+        return orjson.loads(text)
+else:
+    _history_dumps = json.dumps
+    _history_loads = json.loads
+
 # ============================================================
 # CONFIGURATION
 # ============================================================
@@ -101,8 +194,13 @@ class Config:
         return get_app_dir()
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_data_dir() -> Path:
-        """Get data directory - AppData altında (yazma izni için)"""
+        """Get data directory - AppData altında (yazma izni için)
+
+        Cached: mkdir sadece ilk çağrıda çalışır, sonraki çağrılar
+        syscall ödemez (neredeyse her metod bu yoldan geçiyor).
+        """
         # Windows'ta AppData/Local altına yaz
         if sys.platform == 'win32':
             app_data = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
@@ -132,8 +230,9 @@ class Config:
         return Config.get_data_dir() / f"core_{name}.json"
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_html_path() -> Path:
-        """Get index.html path"""
+        """Get index.html path (cached - process boyunca değişmez)"""
         return Config.get_base_path() / "index.html"
 
 # ============================================================
@@ -199,8 +298,8 @@ class DatabaseManager:
                     job.get('stats', {}).get('parts', 0),
                     job.get('stats', {}).get('materials', 0),
                     job.get('stats', {}).get('types', 0),
-                    json.dumps(job.get('results', {}).get('body', [])),
-                    json.dumps(job.get('results', {}).get('thin', []))
+                    _history_dumps(job.get('results', {}).get('body', [])),
+                    _history_dumps(job.get('results', {}).get('thin', []))
                 ))
 
                 cursor.execute("""
@@ -216,6 +315,46 @@ class DatabaseManager:
             print(f"Database error: {e}")
             return False
 
+    def add_history_bulk(self, jobs: List[Dict]) -> bool:
+        """Birden çok işi tek transaction'da ekle - toplu analizde iş başına
+        bir commit/fsync yerine hepsi için bir tane"""
+        if not jobs:
+            return True
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.executemany("""
+                    INSERT INTO history
+                    (job_no, date, file_name, file_path, output_path,
+                     total_parts, material_count, type_count, body_data, thin_data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [(
+                    job.get('job_no', ''),
+                    job.get('date', ''),
+                    job.get('file_name', ''),
+                    job.get('file_path', ''),
+                    job.get('output_path', ''),
+                    job.get('stats', {}).get('parts', 0),
+                    job.get('stats', {}).get('materials', 0),
+                    job.get('stats', {}).get('types', 0),
+                    _history_dumps(job.get('results', {}).get('body', [])),
+                    _history_dumps(job.get('results', {}).get('thin', []))
+                ) for job in jobs])
+
+                cursor.execute("""
+                    UPDATE stats SET
+                        total_jobs = total_jobs + ?,
+                        total_parts = total_parts + ?,
+                        last_updated = CURRENT_TIMESTAMP
+                    WHERE id = 1
+                """, (len(jobs),
+                      sum(job.get('stats', {}).get('parts', 0) for job in jobs)))
+                conn.commit()
+                return True
+        except Exception as e:
+            print(f"Database error: {e}")
+            return False
+
     def delete_history(self, job_ids: List[int]) -> Dict:
         try:
             with sqlite3.connect(self.db_path) as conn:
@@ -268,14 +407,59 @@ class DatabaseManager:
                         'types': row['type_count']
                     },
                     'results': {
-                        'body': json.loads(row['body_data'] or '[]'),
-                        'thin': json.loads(row['thin_data'] or '[]')
+                        'body': _history_loads(row['body_data'] or '[]'),
+                        'thin': _history_loads(row['thin_data'] or '[]')
                     }
                 } for row in rows]
         except Exception as e:
             print(f"Database error: {e}")
             return []
 
+    def get_history_raw(self, limit: int = 100) -> List[Dict]:
+        """get_history gibi, ama body/thin JSON metni çözülmeden ham döner.
+
+        Yedekleme bu metni olduğu gibi dosyaya akıtır; satır başına
+        json.loads + json.dumps gidiş-dönüşü yapılmaz.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT * FROM history ORDER BY created_at DESC LIMIT ?
+                """, (limit,))
+                rows = cursor.fetchall()
+
+                return [{
+                    'id': row['id'],
+                    'job_no': row['job_no'],
+                    'date': row['date'],
+                    'file_name': row['file_name'],
+                    'file_path': row['file_path'],
+                    'output_path': row['output_path'],
+                    'stats': {
+                        'parts': row['total_parts'],
+                        'materials': row['material_count'],
+                        'types': row['type_count']
+                    },
+                    'body_json': row['body_data'] or '[]',
+                    'thin_json': row['thin_data'] or '[]'
+                } for row in rows]
+        except Exception as e:
+            print(f"Database error: {e}")
+            return []
+
+    def get_history_count(self) -> int:
+        """Geçmişteki kayıt sayısı - tüm satırları çekmeden SELECT COUNT"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(1) FROM history")
+                return cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Database error: {e}")
+            return 0
+
     def get_history_by_ids(self, job_ids: List[int]) -> List[Dict]:
         try:
             with sqlite3.connect(self.db_path) as conn:
@@ -298,8 +482,8 @@ class DatabaseManager:
                         'types': row['type_count']
                     },
                     'results': {
-                        'body': json.loads(row['body_data'] or '[]'),
-                        'thin': json.loads(row['thin_data'] or '[]')
+                        'body': _history_loads(row['body_data'] or '[]'),
+                        'thin': _history_loads(row['thin_data'] or '[]')
                     }
                 } for row in rows]
         except Exception as e:
@@ -344,6 +528,8 @@ class JsonDataManager:
     """JSON file manager for settings and materials"""
 
     def __init__(self):
+        self._db_path = str(Config.get_db_path())
+        self._init_learned_table()
         self.default_settings = {
             "standart_yukseklik": 720,
             "standart_derinlik": 580,
@@ -376,7 +562,7 @@ class JsonDataManager:
         try:
             with open(str(path), 'r', encoding='utf-8') as f:
                 return json.load(f)
-        except:
+        except (OSError, json.JSONDecodeError):
             return default
 
     def _write_json(self, name: str, data: Any) -> bool:
@@ -421,37 +607,135 @@ class JsonDataManager:
         return self._write_json('materials', {})
 
     # ============================================================
-    # LEARNED PARTS - Öğrenilen Parça Tipleri
+    # LEARNED PARTS - Öğrenilen Parça Tipleri (SQLite)
+    # Eskiden core_learned_parts.json'da tutuluyordu; tek kayıt
+    # sorgusu için tüm dosyayı okumak ve her kayıtta tüm dosyayı
+    # yeniden yazmak gerekiyordu. Artık PK index'li tablo.
     # ============================================================
-    
+
+    _LEARNED_KEY_RE = re.compile(r'^(\d+)x(\d+)_(.*)$')
+
+    def _init_learned_table(self):
+        """learned_parts tablosunu oluştur ve eski JSON'u bir kez içeri aktar"""
+        with sqlite3.connect(self._db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS learned_parts (
+                    boy INTEGER,
+                    en INTEGER,
+                    malzeme TEXT,
+                    part_type TEXT,
+                    PRIMARY KEY (boy, en, malzeme)
+                ) WITHOUT ROWID
+            """)
+            conn.commit()
+
+        # Tek seferlik migrasyon: eski JSON varsa içeri al ve .bak yap
+        old_path = Config.get_json_path('learned_parts')
+        if old_path.exists():
+            learned = self._read_json('learned_parts', {})
+            rows = []
+            for key, part_type in learned.items():
+                match = self._LEARNED_KEY_RE.match(str(key))
+                if match:
+                    rows.append((int(match.group(1)), int(match.group(2)),
+                                 match.group(3), part_type))
+            if rows:
+                with sqlite3.connect(self._db_path) as conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO learned_parts VALUES (?, ?, ?, ?)",
+                        rows
+                    )
+                    conn.commit()
+            try:
+                old_path.rename(old_path.with_suffix('.json.bak'))
+            except OSError:
+                pass
+
     def get_learned_parts(self) -> Dict:
         """Öğrenilen parça tiplerini döndür - {ölçü_malzeme: parça_tipi}"""
-        return self._read_json('learned_parts', {})
-    
+        return {f"{boy}x{en}_{malzeme}": part_type
+                for boy, en, malzeme, part_type in self.get_learned_parts_rows()}
+
+    def get_learned_parts_rows(self) -> List[tuple]:
+        """Öğrenilen parçaları (boy, en, malzeme, part_type) satırları olarak döndür
+
+        Vektörize analiz yolu bu ham satırları doğrudan DataFrame join'ine
+        verir; anahtar string'i hiç kurulmaz.
+        """
+        try:
+            with sqlite3.connect(self._db_path) as conn:
+                return conn.execute(
+                    "SELECT boy, en, malzeme, part_type FROM learned_parts"
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return []
+
     def save_learned_part(self, boy: int, en: int, malzeme: str, part_type: str) -> bool:
         """Tek bir parça tipini öğren"""
-        learned = self.get_learned_parts()
-        key = f"{boy}x{en}_{malzeme}"
-        learned[key] = part_type
-        return self._write_json('learned_parts', learned)
-    
+        try:
+            with sqlite3.connect(self._db_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO learned_parts VALUES (?, ?, ?, ?)",
+                    (int(boy), int(en), malzeme, part_type)
+                )
+                conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return False
+
     def save_learned_parts_bulk(self, parts: List[Dict]) -> bool:
-        """Birden fazla parça tipini öğren"""
-        learned = self.get_learned_parts()
-        for part in parts:
-            key = f"{part['boy']}x{part['en']}_{part['malzeme']}"
-            learned[key] = part['partType']
-        return self._write_json('learned_parts', learned)
-    
+        """Birden fazla parça tipini öğren - tek transaction'da"""
+        try:
+            rows = [(int(p['boy']), int(p['en']), p['malzeme'], p['partType'])
+                    for p in parts]
+            with sqlite3.connect(self._db_path) as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO learned_parts VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                conn.commit()
+            return True
+        except (sqlite3.Error, KeyError, ValueError) as e:
+            print(f"Database error: {e}")
+            return False
+
     def get_learned_part_type(self, boy: int, en: int, malzeme: str) -> Optional[str]:
-        """Öğrenilmiş parça tipini getir"""
-        learned = self.get_learned_parts()
-        key = f"{boy}x{en}_{malzeme}"
-        return learned.get(key)
-    
+        """Öğrenilmiş parça tipini getir - PK index üzerinden nokta sorgusu"""
+        try:
+            with sqlite3.connect(self._db_path) as conn:
+                row = conn.execute(
+                    "SELECT part_type FROM learned_parts WHERE boy=? AND en=? AND malzeme=?",
+                    (int(boy), int(en), malzeme)
+                ).fetchone()
+                return row[0] if row else None
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return None
+
     def clear_learned_parts(self) -> bool:
         """Tüm öğrenilmiş parça tiplerini sil"""
-        return self._write_json('learned_parts', {})
+        try:
+            with sqlite3.connect(self._db_path) as conn:
+                conn.execute("DELETE FROM learned_parts")
+                conn.commit()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return False
+
+    def restore_learned_parts(self, learned: Dict) -> bool:
+        """Yedekten gelen {ölçü_malzeme: parça_tipi} sözlüğünü içeri aktar"""
+        parts = []
+        for key, part_type in learned.items():
+            match = self._LEARNED_KEY_RE.match(str(key))
+            if match:
+                parts.append({'boy': int(match.group(1)), 'en': int(match.group(2)),
+                              'malzeme': match.group(3), 'partType': part_type})
+        if not parts:
+            return True
+        return self.save_learned_parts_bulk(parts)
 
 # ============================================================
 # USER MANAGER
@@ -475,7 +759,7 @@ class UserManager:
                 return {}
             with open(str(self._users_file), 'r', encoding='utf-8') as f:
                 return json.load(f)
-        except:
+        except (OSError, json.JSONDecodeError):
             return {}
 
     def _save_users(self, users: Dict) -> bool:
@@ -483,7 +767,7 @@ class UserManager:
             with open(str(self._users_file), 'w', encoding='utf-8') as f:
                 json.dump(users, f, ensure_ascii=False, indent=4)
             return True
-        except:
+        except (OSError, TypeError):
             return False
 
     def _hash_password(self, password: str) -> str:
@@ -496,7 +780,8 @@ class UserManager:
         if BCRYPT_AVAILABLE:
             try:
                 return bcrypt.checkpw(password.encode(), hashed.encode())
-            except:
+            except (ValueError, TypeError):
+                # Eski SHA256 hash'leri bcrypt formatında değil
                 return hashlib.sha256(password.encode()).hexdigest() == hashed
         else:
             return hashlib.sha256(password.encode()).hexdigest() == hashed
@@ -651,7 +936,7 @@ class UserManager:
             if session_path.exists():
                 session_path.unlink()
             return True
-        except:
+        except OSError:
             return False
 
 
@@ -660,6 +945,272 @@ class UserManager:
 # EXCEL ANALYZER - BELGEYE UYGUN VERSİYON
 # ============================================================
 
+def _xlsx_headers(header_row):
+    """Başlık satırından pd.read_excel uyumlu adlar ve tutulacak sütun
+    indeksleri üret (Unnamed/duplicate adlandırması dahil).
+
+    Sadece ihtiyaç duyulan sütunlar tutulur - mapping tam başlık listesi
+    üzerinden hesaplandığı için konuma dayalı fallback'ler etkilenmez.
+    Şema tanınamazsa güvenli tarafta kalınır ve her şey okunur.
+    """
+    headers = []
+    seen = {}
+    for i, h in enumerate(header_row):
+        name = f'Unnamed: {i}' if h is None else str(h)
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        headers.append(name)
+
+    mapping = ExcelAnalyzer._map_columns(tuple(headers))
+    if {'olcu1', 'olcu2', 'malzeme'} <= mapping.keys():
+        needed = set(mapping.values())
+        keep = [i for i, h in enumerate(headers) if h in needed]
+    else:
+        keep = list(range(len(headers)))
+    return headers, keep
+
+def _fast_read_xlsx(file_path: str):
+    """xlsx'i openpyxl read-only akışıyla oku ve DataFrame kur.
+
+    pd.read_excel'in genel amaçlı yolu her hücreyi stil/tip makinesinden
+    geçirir; read-only iter_rows satırları values_only akıtır ve kolon
+    listeleri tek geçişte dolar. Başlık adlandırması (Unnamed/duplicate)
+    pd.read_excel ile uyumlu tutulur.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header_row = next(rows, None)
+        if header_row is None:
+            return pd.DataFrame()
+
+        headers, keep = _xlsx_headers(header_row)
+
+        columns = [[] for _ in keep]
+        # pd.read_excel sondaki tamamen boş satırları atar; bayat dimension
+        # kaydı olan dosyalar (Excel'de satır silinince tipik) hayalet satır
+        # üretmesin diye boş satırlar sayılır ve ancak arkadan dolu bir
+        # satır gelirse yazılır
+        pending_empty = 0
+        for row in rows:
+            if not any(v is not None for v in row):
+                pending_empty += 1
+                continue
+            if pending_empty:
+                for col in columns:
+                    col.extend([None] * pending_empty)
+                pending_empty = 0
+            # read-only modda satır sonundaki boş hücreler kısa gelebilir
+            row_len = len(row)
+            for out_i, i in enumerate(keep):
+                columns[out_i].append(row[i] if i < row_len else None)
+
+        data = dict(enumerate(columns))
+        df = pd.DataFrame(data)
+        df.columns = [headers[i] for i in keep]
+        return df
+    finally:
+        wb.close()
+
+def _read_input_frame(file_path: str):
+    """Girdi dosyasını (xlsx/csv) DataFrame olarak oku.
+
+    CSV için polars kuruluysa çok çekirdekli Rust okuyucusu kullanılır ve
+    sonuç pandas'a çevrilir; xlsx/xlsm için openpyxl akış okuyucusu,
+    diğer formatlar için pandas kullanılır.
+    """
+    lower = file_path.lower()
+    if lower.endswith('.csv'):
+        if POLARS_AVAILABLE:
+            import polars as pl
+            pldf = pl.read_csv(file_path, infer_schema_length=1000, ignore_errors=True)
+            return pldf.to_pandas()
+        return pd.read_csv(file_path)
+    if lower.endswith(('.xlsx', '.xlsm')):
+        return _fast_read_xlsx(file_path)
+    return pd.read_excel(file_path)
+
+def _iter_row_batches(file_path: str, batch_size: int = 10000):
+    """Büyük xlsx dosyalarını batch_size satırlık DataFrame'ler halinde akıt.
+
+    Tüm tabloyu tek seferde belleğe kurmak yerine openpyxl read-only
+    akışından parça parça frame üretir; tepe bellek tüm satırlar yerine
+    bir batch ile sınırlı kalır.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header_row = next(rows, None)
+        if header_row is None:
+            yield pd.DataFrame()
+            return
+
+        headers, keep = _xlsx_headers(header_row)
+        out_names = [headers[i] for i in keep]
+
+        batch = []
+        # _fast_read_xlsx ile aynı kural: bayat dimension'dan gelen sondaki
+        # tamamen boş satırlar atılır, aradakiler (pandas gibi) None kalır
+        pending_empty = 0
+        empty_row = (None,) * len(keep)
+        for row in rows:
+            if not any(v is not None for v in row):
+                pending_empty += 1
+                continue
+            if pending_empty:
+                batch.extend([empty_row] * pending_empty)
+                pending_empty = 0
+            # read-only modda satır sonundaki boş hücreler kısa gelebilir
+            row_len = len(row)
+            batch.append(tuple(row[i] if i < row_len else None for i in keep))
+            if len(batch) >= batch_size:
+                yield pd.DataFrame(batch, columns=out_names)
+                batch = []
+
+        # Kalan satırlar; hiç veri yoksa da kolonlu boş frame dön ki
+        # sütun mapping'i yine çalışsın
+        yield pd.DataFrame(batch, columns=out_names)
+    finally:
+        wb.close()
+
+def _coerce_int32(values, fill=0):
+    """Sayıya zorla, boşları doldur, tek adımda int32'ye indir.
+
+    to_numeric→fillna→astype zincirindeki ara Series kopyaları yerine
+    NumPy dizisi üzerinde tek geçiş yapar.
+    """
+    arr = pd.to_numeric(values, errors='coerce').to_numpy()
+    if arr.dtype.kind == 'f':
+        # to_numpy görünüm (salt okunur) dönebilir; kopyalı nan_to_num
+        arr = np.nan_to_num(arr, nan=fill)
+    return arr.astype(np.int32, copy=False)
+
+@functools.lru_cache(maxsize=1)
+def _get_xlsx_styles() -> Dict:
+    """openpyxl stil nesnelerini bir kez kur ve paylaş.
+
+    Font/PatternFill/Border nesneleri değişmez (immutable); her export
+    çağrısında yeniden kurmak hem gereksiz ayırma hem de workbook'un
+    paylaşılan stil tablosuna yinelenen kayıt demek. openpyxl burada
+    tembel import edildiği için modül sabiti yerine lru_cache'li fabrika.
+    """
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+    from openpyxl.styles.fonts import DEFAULT_FONT
+
+    thin = Side(style='thin')
+    thin_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    center = Alignment(horizontal='center')
+    gray_fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
+    # Veri hücresi fontu workbook varsayılanının ta kendisi: NamedStyle boş
+    # Font() ile yazılırsa stil tablosuna ayrı (adsız) bir font kaydı açar
+    base_font = DEFAULT_FONT
+    return {
+        'header_font': Font(bold=True, color='FFFFFF'),
+        'header_fill_18mm': PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid'),  # Mavi
+        'header_fill_16mm': PatternFill(start_color='8B5CF6', end_color='8B5CF6', fill_type='solid'),  # Mor
+        'header_fill_8mm': PatternFill(start_color='70AD47', end_color='70AD47', fill_type='solid'),   # Yeşil
+        'title_font': Font(bold=True, size=14),
+        'thin_border': thin_border,
+        'center': center,
+        # Veri hücreleri için NamedStyle çifti: hücre başına üç ayrı öznitelik
+        # ataması (border/alignment/fill) yerine tek 'cell.style = ad' ataması;
+        # kaydetmede tekilleştirme de hücre başına tek XF kaydına iner.
+        # Workbook'a wb.add_named_style(...) ile bir kez kaydedilmeli.
+        'plain_data_style': NamedStyle(name='plain_data', font=base_font,
+                                       border=thin_border, alignment=center),
+        'zebra_data_style': NamedStyle(name='zebra_data', font=base_font,
+                                       border=thin_border, alignment=center,
+                                       fill=gray_fill),
+    }
+
+def _export_summary_xlsxwriter(output_path: str, df_18mm, df_16mm, df_8mm) -> None:
+    """Özet tablolarını xlsxwriter ile yaz - openpyxl yolunun hızlı muadili.
+
+    Hücre başına nesne kurup stil atamak yerine satır-major tek geçişte
+    yazar; Format nesneleri bir kez oluşturulur, xlsxwriter bunları XF
+    kayıtlarında tekilleştirir ve kapanışta XML'i doğrudan zip akışına
+    yazar. Çıktı düzeni openpyxl yolundakiyle aynıdır (3 tablo yan yana,
+    zebra efekti, renkli başlıklar).
+
+    constant_memory: bellekte yalnız geçerli satır tutulur, her satır
+    bitince diske akıtılır - bu yüzden yazım sırası kesinlikle satır-major
+    olmalıdır (aşağıdaki döngü zaten öyle).
+    """
+    import xlsxwriter
+
+    column_order = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ', 'ADET']
+    widths_normal = [9, None, 9.5, 9.5, 14.2, 9]  # None = otomatik
+    widths_8mm = [9, None, 9.5, 9.5, 15.7, 9]
+
+    wb = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+    ws = wb.add_worksheet('Kesim Listesi')
+
+    title_fmt = wb.add_format({'bold': True, 'font_size': 14, 'align': 'center'})
+    cell_fmt = wb.add_format({'align': 'center', 'border': 1})
+    zebra_fmt = wb.add_format({'align': 'center', 'border': 1, 'bg_color': '#F2F2F2'})
+
+    tables = []
+    start = 0
+    for df, title, color, widths in (
+            (df_18mm, '18mm Parçalar', '#4472C4', widths_normal),   # Mavi
+            (df_16mm, '16mm Parçalar', '#8B5CF6', widths_normal),   # Mor
+            (df_8mm, '8mm Parçalar', '#70AD47', widths_8mm)):       # Yeşil
+        header_fmt = wb.add_format({'bold': True, 'font_color': '#FFFFFF',
+                                    'bg_color': color, 'align': 'center', 'border': 1})
+        if df.empty:
+            rows = []
+        else:
+            cols = [c for c in column_order if c in df.columns]
+            rows = list(df[cols].itertuples(index=False, name=None))
+
+        # Sütun genişlikleri (None = MALZEME içeriğine göre otomatik)
+        for i, width in enumerate(widths):
+            if width is None:
+                max_len = len('MALZEME')
+                if not df.empty and 'MALZEME' in df.columns:
+                    # Benzersiz değerler üzerinden O(#unique) uzunluk taraması
+                    uniq = pd.Index(df['MALZEME'].unique()).astype(str)
+                    if len(uniq):
+                        max_len = max(max_len, int(uniq.str.len().max()))
+                ws.set_column(start + i, start + i, max_len + 2)
+            else:
+                ws.set_column(start + i, start + i, width)
+
+        tables.append((start, rows, title, header_fmt))
+        start += len(column_order) + 1  # tablolar arası 1 sütun boşluk
+
+    # Başlık ve header satırları - constant_memory bir satır ileri geçince
+    # öncekini diske akıttığı için önce tüm 0. satır, sonra tüm 1. satır
+    for start, rows, title, header_fmt in tables:
+        ws.merge_range(0, start, 0, start + len(column_order) - 1, title, title_fmt)
+    for start, rows, title, header_fmt in tables:
+        for i, name in enumerate(column_order):
+            ws.write(1, start + i, name, header_fmt)
+
+    # Veri satırları - satır-major tek geçiş, zebra efekti. '(Veri yok)'
+    # da ilk veri satırında yazılır; constant_memory modunda geriye dönüp
+    # satır yazılamaz. En az bir tur dönülür ki boş tablolar da yazılsın.
+    max_rows = max(1, *(len(rows) for _, rows, _, _ in tables))
+    for r in range(max_rows):
+        fmt = zebra_fmt if r % 2 == 1 else cell_fmt
+        for start, rows, _, _ in tables:
+            if r < len(rows):
+                for i, value in enumerate(rows[r]):
+                    ws.write(2 + r, start + i, value, fmt)
+            elif r == 0:
+                ws.write(2, start, '(Veri yok)')
+
+    wb.close()
+
 class ExcelAnalyzer:
     """
     Excel file analyzer and processor
@@ -696,7 +1247,40 @@ class ExcelAnalyzer:
             'ust': {'yukseklik': 720, 'derinlik': 330},
             'boy': {'yukseklik': 2100, 'derinlik': 580}
         }
-    
+        # Parse edilmiş frame'ler için küçük LRU - check_file hemen ardından
+        # analyze_* aynı dosyayı ikinci kez parse etmesin
+        self._df_cache: OrderedDict = OrderedDict()
+        self._df_cache_lock = threading.Lock()
+
+    _DF_CACHE_SIZE = 4
+
+    # Bu boyutun üzerindeki xlsx girdileri tek parça yerine
+    # _iter_row_batches ile akıtılarak işlenir
+    _STREAM_SIZE_BYTES = 8 * 1024 * 1024
+    _STREAM_BATCH_ROWS = 10000
+
+    def _read_frame_cached(self, file_path: str):
+        """Dosyayı (yol, mtime, boyut) anahtarlı LRU üzerinden oku.
+
+        Çağıranlar frame'e kolon eklediği için kopya döner; kopya,
+        xlsx'i yeniden parse etmekten çok daha ucuz.
+        """
+        st = os.stat(file_path)
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        # Kilit yalnızca sözlük erişimini korur; parse kilidin dışında
+        # yapılır ki paralel dosya kontrolü serileşmesin
+        with self._df_cache_lock:
+            cached = self._df_cache.get(key)
+            if cached is not None:
+                self._df_cache.move_to_end(key)
+        if cached is None:
+            cached = _read_input_frame(file_path)
+            with self._df_cache_lock:
+                self._df_cache[key] = cached
+                if len(self._df_cache) > self._DF_CACHE_SIZE:
+                    self._df_cache.popitem(last=False)
+        return cached.copy()
+
     def _get_custom_module_for_poz(self, poz: str) -> Dict:
         """POZ için özel modül ayarlarını döndür"""
         return self.custom_modules.get(poz)
@@ -707,10 +1291,7 @@ class ExcelAnalyzer:
             return {'success': False, 'error': 'pandas kütüphanesi yüklü değil!'}
 
         try:
-            if file_path.lower().endswith('.csv'):
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
+            df = self._read_frame_cached(file_path)
 
             # Sütun kontrolü - Esnek sütun isimleri
             # Önce standart isimleri dene, yoksa indeks bazlı erişim
@@ -726,11 +1307,13 @@ class ExcelAnalyzer:
                 if len(info16_values) > 0:
                     job_no = str(info16_values[0]).strip()
 
-            # Malzemeleri al (L sütunu veya Malzeme Kodu)
+            # Malzemeleri al (L sütunu veya Malzeme Kodu) - strip/filtre
+            # Python döngüsü yerine tek vektörize ifadeyle
             malzeme_col = col_mapping.get('malzeme')
             if malzeme_col and malzeme_col in df.columns:
-                materials = df[malzeme_col].dropna().unique().tolist()
-                materials = [str(m).strip() for m in materials if str(m).strip() and str(m).strip().lower() != 'nan']
+                s = df[malzeme_col].dropna().astype(str).str.strip()
+                s = s[(s != '') & (s.str.lower() != 'nan')]
+                materials = s.unique().tolist()
             else:
                 materials = []
 
@@ -746,65 +1329,104 @@ class ExcelAnalyzer:
                 'job_no': job_no
             }
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {'success': False, 'error': str(e)}
 
     def _get_column_mapping(self, df) -> Dict:
-        """Excel sütunlarını belirle - esnek mapping"""
+        """Excel sütunlarını belirle - esnek mapping
+
+        Aynı sütun imzası için sonuç cache'lenir; check_file +
+        analyze_* akışında heuristik tarama bir kez çalışır.
+        """
+        return dict(self._map_columns(tuple(df.columns)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _map_columns(columns: tuple) -> Dict:
         mapping = {}
-        columns = df.columns.tolist()
-        
+        columns = list(columns)
+
         # Debug: Sütunları yazdır
         print(f"Excel columns: {columns}")
-        
-        # Öncelikli olarak bilinen sütun isimlerini ara
+
+        # Bilinen §542 / #8542 şemaları için hızlı yol: branch'li heuristik
+        # taramayı atla, mapping'i sabit kur. Davranış heuristikle birebir
+        # aynı tutulur - 'Info1' alt dizgisinin Info16 ile de eşleşip son
+        # eşleşmenin kazanması dahil.
+        cols = set(columns)
+        for prefix in ('§542', '#8542'):
+            if {f'{prefix} Info4', f'{prefix} Info5', f'{prefix} Info1',
+                    'Malzeme Kodu', 'Uzunluk', 'Genişlik'} <= cols:
+                mapping = {
+                    'poz': f'{prefix} Info4',
+                    'modul': f'{prefix} Info5',
+                    'kanalli': next(c for c in reversed(columns) if 'Info1' in str(c)),
+                    'malzeme': 'Malzeme Kodu',
+                    'olcu1': 'Uzunluk',
+                    'olcu2': 'Genişlik',
+                }
+                if f'{prefix} Info3' in cols:
+                    mapping['modul_kodu'] = f'{prefix} Info3'
+                if f'{prefix} Info16' in cols:
+                    mapping['info16'] = f'{prefix} Info16'
+                # Heuristik döngüyle aynı adet kuralı: _ADET_NAMES veya
+                # 'sipari' eşleşmelerinden sonuncusu kazanır - Adet/Miktar/Qty
+                # başlıklı §542 dosyaları da miktarını kaybetmesin
+                for c in columns:
+                    c_lower = str(c).lower().strip()
+                    if c_lower in _ADET_NAMES or 'sipari' in c_lower:
+                        mapping['adet'] = c
+                print(f"Column mapping: {mapping}")
+                return mapping
+
+        # Öncelikli olarak bilinen sütun isimlerini ara - tek geçiş,
+        # str()/lower() sütun başına bir kez, ad listeleri sabit kümelerde
         for col in columns:
             col_str = str(col)
             col_lower = col_str.lower().strip()
-            
+
             # POZ (Info4) - hem §542 hem #8542 destekle
-            if col_lower in ['poz', 'poz no', 'poz numarası']:
+            if col_lower in _POZ_NAMES:
                 mapping['poz'] = col
             elif 'Info4' in col_str:
                 mapping['poz'] = col
-            
+
             # Modül adı (Info5) - GENİŞLİK BURADAN ALINACAK
-            if col_lower in ['modül', 'modul', 'modül adı', 'modul adi']:
+            if col_lower in _MODUL_NAMES:
                 mapping['modul'] = col
             elif 'Info5' in col_str:
                 mapping['modul'] = col
-            
+
             # Modül kodu (Info3) - Genişlik kontrolü için
             if 'Info3' in col_str:
                 mapping['modul_kodu'] = col
-            
+
             # Adet/Sipariş (H sütunu) - #8542 formatında "Sipariş" veya "Info2" olabilir
-            if col_lower in ['adet', 'miktar', 'qty', 'quantity', 'sipariş', 'siparis', 'siparış']:
+            if col_lower in _ADET_NAMES:
                 mapping['adet'] = col
             # #8542 formatında Sipariş sütunu header'da "Sipariş" veya başka bir şey olabilir
             # Sütun adında "Sipariş" veya "sipari" varsa
             elif 'sipari' in col_lower or 'sipariş' in col_lower:
                 mapping['adet'] = col
-            
+
             # Ölçü 1 (I sütunu) - Uzunluk (parça boyu)
-            if col_lower in ['uzunluk', 'boy', 'length', 'ölçü 1', 'olcu 1']:
+            if col_lower in _OLCU1_NAMES:
                 mapping['olcu1'] = col
-            
+
             # Ölçü 2 (J sütunu) - Genişlik (parça eni) - SÜTUN VARSA
-            if col_lower in ['genişlik', 'genislik', 'en', 'width', 'ölçü 2', 'olcu 2']:
+            if col_lower in _OLCU2_NAMES:
                 mapping['olcu2'] = col
-            
+
             # Kanallı (Info1) - hem §542 hem #8542 destekle
-            if col_lower in ['kanallı', 'kanalli', 'kanal']:
+            if col_lower in _KANALLI_NAMES:
                 mapping['kanalli'] = col
             elif 'Info1' in col_str:
                 mapping['kanalli'] = col
-            
+
             # Malzeme (L sütunu)
-            if col_lower in ['malzeme', 'malzeme kodu', 'material', 'malzeme adı']:
+            if col_lower in _MALZEME_NAMES:
                 mapping['malzeme'] = col
-            
+
             # Info16 (İş numarası)
             if 'Info16' in col_str:
                 mapping['info16'] = col
@@ -847,530 +1469,469 @@ class ExcelAnalyzer:
         print(f"Column mapping: {mapping}")
         return mapping
 
-    def analyze_and_export(self, file_path: str, output_path: str, custom_depths: Dict = None) -> Dict:
+    def _summarize_frame(self, df, col_map: Dict, settings: Dict,
+                         materials_db: Dict, learned_rows: List) -> 'pd.DataFrame':
+        """Bir girdi frame'ini sınıflandır ve kısmi özet döndür.
+
+        analyze_and_export'un çekirdeği: veri hazırlama, parça tipi
+        belirleme ve gruplama. Batch batch çağrılabilsin diye ayrı metod;
+        dönen kısmi özetler sonda tekrar gruplanarak birleştirilir.
         """
-        Excel dosyasını analiz et ve kesim listesi oluştur.
+        # ============================================================
+        # STANDART ÖLÇÜLER (Belgeden)
+        # ============================================================
+        ALT_DOLAP_YUKSEKLIK = settings.get('standart_yukseklik', 720)
+        ALT_DOLAP_DERINLIK = settings.get('standart_derinlik', 580)
+        UST_DOLAP_YUKSEKLIK = settings.get('ust_dolap_yukseklik', 720)
+        UST_DOLAP_DERINLIK = settings.get('ust_dolap_derinlik', 330)
+        BOY_DOLAP_YUKSEKLIK = settings.get('boy_dolap_yukseklik', 2100)
+        BOY_DOLAP_DERINLIK = settings.get('boy_dolap_derinlik', 580)
         
-        BELGE KURALLARI UYGULANIR:
-        - Kalınlıklar: 18mm (gövde), 16mm (çekmece yan), 8mm (arkalık)
-        - Parça formülleri belgeye göre
-        """
-        if not PANDAS_AVAILABLE:
-            return {'success': False, 'error': 'pandas kütüphanesi yüklü değil!'}
-
-        try:
-            # Dosyayı oku
-            if file_path.lower().endswith('.csv'):
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
-
-            settings = self.data_manager.get_settings()
-            materials_db = self.data_manager.get_materials()
-            
-            # Sütun mapping
-            col_map = self._get_column_mapping(df)
-
-            # Job number - Info16'dan al
-            job_no = None
-            if '§542 Info16' in df.columns:
-                info16_values = df['§542 Info16'].dropna().unique()
-                if len(info16_values) > 0:
-                    job_no = str(info16_values[0]).strip()
-
-            # ============================================================
-            # STANDART ÖLÇÜLER (Belgeden)
-            # ============================================================
-            ALT_DOLAP_YUKSEKLIK = settings.get('standart_yukseklik', 720)
-            ALT_DOLAP_DERINLIK = settings.get('standart_derinlik', 580)
-            UST_DOLAP_YUKSEKLIK = settings.get('ust_dolap_yukseklik', 720)
-            UST_DOLAP_DERINLIK = settings.get('ust_dolap_derinlik', 330)
-            BOY_DOLAP_YUKSEKLIK = settings.get('boy_dolap_yukseklik', 2100)
-            BOY_DOLAP_DERINLIK = settings.get('boy_dolap_derinlik', 580)
-            
-            # Düşüm değerleri (Belgeden)
-            YAN_DUSUM = 36  # Alt-üst için genişlikten düşülen
-            ALT_UST_DERINLIK_DUSUM = 1  # Alt-üst için derinlikten düşülen
-            RAF_GENISLIK_DUSUM = 37  # Raf için genişlikten düşülen
-            RAF_DERINLIK_ALT = 50  # Alt dolap rafı için derinlikten düşülen
-            RAF_DERINLIK_UST = 40  # Üst dolap rafı için derinlikten düşülen
-            ARKALIK_DUSUM = 18  # Arkalık için her iki kenardan düşülen
-            
-            # Sabit kalınlıklar (Belgeden)
-            GOVDE_KALINLIK = 18
-            CEKMECE_YAN_KALINLIK = 16
-            ARKALIK_KALINLIK = 8
-            
-            TOLERANS = settings.get('tolerans', 10)  # 10mm tolerans - daha esnek eşleşme
-
-            # ============================================================
-            # VERİ HAZIRLAMA
-            # ============================================================
-            
-            # Ölçüleri al
-            olcu1_col = col_map.get('olcu1', 'Uzunluk')
-            olcu2_col = col_map.get('olcu2', 'Genişlik')
-            malzeme_col = col_map.get('malzeme', 'Malzeme Kodu')
-            modul_col = col_map.get('modul', '§542 Info5')
-            poz_col = col_map.get('poz', '§542 Info4')
-            kanalli_col = col_map.get('kanalli', '§542 Info1')
-            
-            # DataFrame'e standart sütunlar ekle
-            df['OLCU1'] = pd.to_numeric(df[olcu1_col], errors='coerce').fillna(0).astype(int)
-            df['OLCU2'] = pd.to_numeric(df[olcu2_col], errors='coerce').fillna(0).astype(int)
-            df['MALZEME'] = df[malzeme_col].fillna('').astype(str).str.strip() if malzeme_col in df.columns else ''
-            
-            # ADET sütununu Excel'den oku (Sipariş sütunu)
-            adet_col = col_map.get('adet')
-            if adet_col and adet_col in df.columns:
-                df['ADET'] = pd.to_numeric(df[adet_col], errors='coerce').fillna(1).astype(int)
-                print(f"ADET sütunu bulundu: {adet_col}")
-            else:
-                df['ADET'] = 1
-                print("ADET sütunu bulunamadı, varsayılan 1 kullanılıyor")
-            
-            # POZ ve Modül bilgisi
-            if modul_col in df.columns:
-                df['MODUL_ADI'] = df[modul_col].fillna('').astype(str)
-            else:
-                df['MODUL_ADI'] = ''
-                
-            if poz_col in df.columns:
-                df['POZ'] = df[poz_col].fillna('').astype(str)
-            else:
-                df['POZ'] = ''
-
-            # ============================================================
-            # MODÜL TİPİ VE GENİŞLİK BELİRLEME
-            # ============================================================
-            
-            def parse_module_info(modul_adi: str) -> tuple:
-                """
-                Modül adından tip ve genişlik çıkar.
-                Örnek: "Alt dolap 60 cm" -> ('ALT', 600)
-                """
-                modul_adi = str(modul_adi).lower().strip()
-                
-                # Tip belirleme
-                if 'üst' in modul_adi or 'ust' in modul_adi:
-                    tip = 'ÜST'
-                elif 'boy' in modul_adi:
-                    tip = 'BOY'
-                else:
-                    tip = 'ALT'
-                
-                # Genişlik belirleme (cm'den mm'ye)
-                genislik = None
-                cm_match = re.search(r'(\d+)\s*cm', modul_adi)
-                if cm_match:
-                    genislik = int(cm_match.group(1)) * 10  # cm -> mm
-                
-                return tip, genislik
-            
-            # Her satır için modül bilgisi
-            df['MODUL_TIP'] = ''
-            df['MODUL_GENISLIK'] = 0
-            
-            for idx, row in df.iterrows():
-                tip, genislik = parse_module_info(row['MODUL_ADI'])
-                df.at[idx, 'MODUL_TIP'] = tip
-                df.at[idx, 'MODUL_GENISLIK'] = genislik if genislik else 600  # Varsayılan 600mm
+        # Düşüm değerleri (Belgeden)
+        YAN_DUSUM = 36  # Alt-üst için genişlikten düşülen
+        ALT_UST_DERINLIK_DUSUM = 1  # Alt-üst için derinlikten düşülen
+        RAF_GENISLIK_DUSUM = 37  # Raf için genişlikten düşülen
+        RAF_DERINLIK_ALT = 50  # Alt dolap rafı için derinlikten düşülen
+        RAF_DERINLIK_UST = 40  # Üst dolap rafı için derinlikten düşülen
+        ARKALIK_DUSUM = 18  # Arkalık için her iki kenardan düşülen
+        
+        # Sabit kalınlıklar (Belgeden)
+        GOVDE_KALINLIK = 18
+        CEKMECE_YAN_KALINLIK = 16
+        ARKALIK_KALINLIK = 8
+        
+        TOLERANS = settings.get('tolerans', 10)  # 10mm tolerans - daha esnek eşleşme
 
-            # ============================================================
-            # KANALLI TESPİTİ
-            # ============================================================
+        # ============================================================
+        # VERİ HAZIRLAMA
+        # ============================================================
+        
+        # Ölçüleri al
+        olcu1_col = col_map.get('olcu1', 'Uzunluk')
+        olcu2_col = col_map.get('olcu2', 'Genişlik')
+        malzeme_col = col_map.get('malzeme', 'Malzeme Kodu')
+        modul_col = col_map.get('modul', '§542 Info5')
+        poz_col = col_map.get('poz', '§542 Info4')
+        kanalli_col = col_map.get('kanalli', '§542 Info1')
+        
+        # DataFrame'e standart sütunlar ekle - ölçüler mm cinsinden,
+        # int32 fazlasıyla yeter; taşınan byte sayısı yarıya iner
+        df['OLCU1'] = _coerce_int32(df[olcu1_col])
+        df['OLCU2'] = _coerce_int32(df[olcu2_col])
+        df['MALZEME'] = df[malzeme_col].fillna('').astype(str).str.strip() if malzeme_col in df.columns else ''
+
+        # ADET sütununu Excel'den oku (Sipariş sütunu)
+        adet_col = col_map.get('adet')
+        if adet_col and adet_col in df.columns:
+            df['ADET'] = _coerce_int32(df[adet_col], fill=1)
+            print(f"ADET sütunu bulundu: {adet_col}")
+        else:
+            df['ADET'] = 1
+            print("ADET sütunu bulunamadı, varsayılan 1 kullanılıyor")
+        
+        # POZ ve Modül bilgisi
+        if modul_col in df.columns:
+            df['MODUL_ADI'] = df[modul_col].fillna('').astype(str)
+        else:
+            df['MODUL_ADI'] = ''
             
-            def is_kanalli(row) -> bool:
-                """K sütunundaki veya Info1'deki kanallı bilgisini kontrol et"""
-                if kanalli_col not in df.columns:
-                    return False
-                
-                kanalli_val = str(row.get(kanalli_col, '')).upper().strip()
-                
-                # True/False kontrolü
-                if kanalli_val in ['TRUE', 'EVET', 'YES', '1', 'VAR']:
-                    return True
-                
-                # Pattern kontrolü: SOL_13+9 veya SAĞ_xxx+xxx
-                if re.search(r'(SOL|SAĞ|SAG)_\d+\+\d+', kanalli_val):
-                    return True
-                
-                return False
+        if poz_col in df.columns:
+            df['POZ'] = df[poz_col].fillna('').astype(str)
+        else:
+            df['POZ'] = ''
+
+        # Arrow destekli string dtype: str.* çağrıları ve groupby anahtarı
+        # Python objeleri yerine C çekirdeklerinde koşar (MALZEME zaten
+        # özet aşamasında category'ye çevrildiği için pyarrow yoksa ek
+        # bir şey yapılmaz)
+        if PYARROW_AVAILABLE:
+            df['MALZEME'] = df['MALZEME'].astype('string[pyarrow]')
+            df['MODUL_ADI'] = df['MODUL_ADI'].astype('string[pyarrow]')
+
+        # ============================================================
+        # MODÜL TİPİ VE GENİŞLİK BELİRLEME - vektörize
+        # Örnek: "Alt dolap 60 cm" -> ('ALT', 600)
+        # ============================================================
+
+        # Türkçe katlama tek translate geçişiyle; 'üst|ust' alternasyonu
+        # düz 'ust' aramasına iner
+        modul_s = df['MODUL_ADI'].str.translate(TR_FOLD).str.lower().str.strip()
+        is_ust = modul_s.str.contains('ust', regex=False, na=False).to_numpy(dtype=bool)
+        is_boy = modul_s.str.contains('boy', regex=False, na=False).to_numpy(dtype=bool)
+        df['MODUL_TIP'] = np.select([is_ust, is_boy], ['ÜST', 'BOY'], default='ALT')
+
+        # Genişlik (cm'den mm'ye), bulunamazsa varsayılan 600mm
+        widths = modul_s.str.extract(_CM_RE, expand=False)
+        df['MODUL_GENISLIK'] = (pd.to_numeric(widths, errors='coerce') * 10).fillna(600).astype(int)
+
+        # ============================================================
+        # KANALLI TESPİTİ
+        # ============================================================
+        
+        # K sütunundaki veya Info1'deki kanallı bilgisi - satır satır regex
+        # yerine kolon üzerinde tek tarama (TRUE/EVET/... veya SOL_13+9 deseni)
+        if kanalli_col in df.columns:
+            kv = df[kanalli_col].astype(str).str.upper().str.strip().str.translate(TR_FOLD)
+            kanalli_mask = (
+                kv.isin(['TRUE', 'EVET', 'YES', '1', 'VAR'])
+                | kv.str.contains(_KANAL_RE, na=False)
+            ).to_numpy()
+        else:
+            kanalli_mask = np.zeros(len(df), dtype=bool)
+
+        # ============================================================
+        # PARÇA TİPİ BELİRLEME - BELGE KURALLARINA GÖRE (vektörize)
+        #
+        # MANTIK:
+        # 0. Önce öğrenilmiş parçalara bak
+        # 1. Malzeme kalınlığına göre tablo belirle (<=8 arkalık, 16 çekmece)
+        # 2. Ölçülere bakarak hangi formüle uyduğunu bul
+        #
+        # FORMÜLLER (Belgeden):
+        # - YAN: 720 x 580 (Alt), 720 x 330 (Üst), 2100 x 580 (Boy)
+        # - ALT-ÜST: (Genişlik-36) x (Derinlik-1) → EN ≈ 579, 329, ...
+        # - RAF Alt: (Genişlik-37) x (Derinlik-50) → EN ≈ 530, ...
+        # - RAF Üst: (Genişlik-37) x (Derinlik-40) → EN ≈ 290, ...
+        # - KAYIT/KUŞAK: Bir kenar 80-140mm civarı
+        #
+        # Kurallar satır satır değil, kolon bazlı maskelerle uygulanır;
+        # np.select ilk uyan kuralı seçtiği için öncelik sırası korunur.
+        # ============================================================
+
+        olcu1 = df['OLCU1'].to_numpy()
+        olcu2 = df['OLCU2'].to_numpy()
+
+        # Ölçüleri sırala - büyük olan BOY, küçük olan EN
+        boy = np.maximum(olcu1, olcu2)
+        en = np.minimum(olcu1, olcu2)
+
+        # Kalınlık HER ZAMAN malzemenin veritabanındaki kalınlığı!
+        kalinlik = df['MALZEME'].map(materials_db).fillna(GOVDE_KALINLIK).astype(int).to_numpy()
+
+        # 0. Öğrenilmiş parça kontrolü - (BOY, EN, MALZEME) üzerinden
+        # hash-join; satır başına anahtar string'i kurulmaz
+        if learned_rows:
+            lp_df = pd.DataFrame(learned_rows,
+                                 columns=['BOY', 'EN', 'MALZEME', 'LEARNED_TYPE'])
+            work = pd.DataFrame({'BOY': boy, 'EN': en,
+                                 'MALZEME': df['MALZEME'].astype(str).to_numpy()})
+            learned_s = work.merge(lp_df, on=['BOY', 'EN', 'MALZEME'],
+                                   how='left')['LEARNED_TYPE']
+        else:
+            learned_s = pd.Series([None] * len(df), dtype=object)
+        learned_mask = learned_s.notna().to_numpy()
+
+        def near(arr, value):
+            return np.abs(arr - value) <= TOLERANS
+
+        # 1. Malzeme kalınlığına göre tablo
+        arkalik_mask = kalinlik <= ARKALIK_KALINLIK
+        cekmece_mask = kalinlik == CEKMECE_YAN_KALINLIK
+
+        # 2. YAN - standart yükseklik x derinlik kombinasyonları
+        near720 = near(boy, 720)
+        near2100 = near(boy, 2100)
+        en330 = near(en, 330)
+        en580 = near(en, 580)
+        yan_mask = (near720 & (en330 | en580)) | (near2100 & en580)
+        # Özel derinlikli yan: yükseklik standart, derinlik makul aralıkta
+        ozel_yan = (near720 | near2100) & (en >= 300) & (en <= 600)
+        yan_mask = yan_mask | (ozel_yan & (kanalli_mask | en330 | en580))
+
+        # 3. ALT-ÜST - EN ≈ derinlik-1 (yaygın derinlik-1 değerleri)
+        # Derinlik merdivenleri tek broadcast ile: |en[:,None] - depths| <= TOL
+        #
+        # Not: eski satır-bazlı kodun bu daldaki modul_gen %50 bölünebilirlik
+        # testi burada bilinçli olarak yok - testin her iki sonucu da aynı
+        # etikete düşüyordu (genel derinlik listesi o satırları zaten
+        # yakalıyor), maskeye eklemek sonucu değiştirmiyor.
+        alt_ust_mask = (np.abs(en[:, None] - ALTUST_DEPTHS[None, :]) <= TOLERANS).any(axis=1)
+
+        # 4. RAF - RAF ASLA KANALLI OLMAZ
+        raf_alt_mask = ~kanalli_mask & (np.abs(en[:, None] - RAF_DEPTHS_ALT[None, :]) <= TOLERANS).any(axis=1)
+        raf_ust_mask = ~kanalli_mask & (np.abs(en[:, None] - RAF_DEPTHS_UST[None, :]) <= TOLERANS).any(axis=1)
+
+        # 5. KAYIT/KUŞAK - bir kenar 80-140mm civarı
+        kayit_mask = ((en >= 80) & (en <= 140)) | ((boy >= 80) & (boy <= 140))
+
+        # 6. DİĞER - hiçbir formüle uymayan (default)
+        parca_tipi = np.select(
+            [
+                learned_mask,
+                arkalik_mask,
+                cekmece_mask,
+                yan_mask & kanalli_mask,
+                yan_mask,
+                alt_ust_mask & kanalli_mask,
+                alt_ust_mask,
+                raf_alt_mask,
+                raf_ust_mask,
+                kayit_mask,
+            ],
+            [
+                learned_s.fillna('').to_numpy(),
+                'ARKALIK',
+                'ÇEKMECE YANI',
+                'YAN (KANALLI)',
+                'YAN',
+                'ALT-ÜST (KANALLI)',
+                'ALT-ÜST',
+                'RAF',
+                'RAF (ÜST)',
+                'KAYIT/KUŞAK',
+            ],
+            default='DİĞER'
+        )
+
+        # ============================================================
+        # SONUÇ TABLOSU
+        # ============================================================
+
+        # Sonuç frame'i tek seferde dizi sözlüğünden kurulur - girdi df'ine
+        # ara kolonlar yazıp ardından seçme/yeniden adlandırma kopyası yok
+        result_df = pd.DataFrame({
+            'POZ': df['POZ'].to_numpy(),
+            'MODÜL': df['MODUL_ADI'].to_numpy(),
+            'MODÜL TİPİ': df['MODUL_TIP'].to_numpy(),
+            'KALINLIK': kalinlik,
+            'MALZEME': df['MALZEME'].to_numpy(),
+            'BOY': boy,
+            'EN': en,
+            'PARÇA TİPİ': parca_tipi,
+            'ADET': df['ADET'].to_numpy(),
+        })
+        
+        # ============================================================
+        # GRUPLAMA VE TOPLAMA
+        # ============================================================
+        
+        # Gruplama anahtarlarını küçült: string kolonlar kategorik koda,
+        # sayısal kolonlar dar tamsayıya - hash değişken boylu UTF-8 yerine
+        # tamsayı kodlar üzerinden çalışır
+        result_df['MALZEME'] = result_df['MALZEME'].astype('category')
+        result_df['PARÇA TİPİ'] = result_df['PARÇA TİPİ'].astype('category')
+        result_df['KALINLIK'] = result_df['KALINLIK'].astype('int16')
+        result_df['BOY'] = result_df['BOY'].astype('int32')
+        result_df['EN'] = result_df['EN'].astype('int32')
+
+        group_cols = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ']
+        return result_df.groupby(group_cols, observed=True).agg({'ADET': 'sum'}).reset_index()
 
-            # ============================================================
-            # ÖĞRENİLMİŞ PARÇALAR
-            # ============================================================
-            learned_parts = self.data_manager.get_learned_parts()
+    def analyze_and_export(self, file_path: str, output_path: str, custom_depths: Dict = None) -> Dict:
+        """
+        Excel dosyasını analiz et ve kesim listesi oluştur.
 
-            # ============================================================
-            # PARÇA TİPİ BELİRLEME - BELGE KURALLARINA GÖRE
-            # ============================================================
-            
-            def determine_part_type(row) -> tuple:
-                """
-                Parça tipini ve kalınlığını ÖLÇÜLERDEN TERSİNE HESAPLAMA ile belirle.
-                
-                MANTIK:
-                0. Önce öğrenilmiş parçalara bak
-                1. Ölçülere bakarak hangi formüle uyduğunu bul
-                2. Formülden modül genişliğini ve tipini çıkar
-                
-                FORMÜLLER (Belgeden):
-                - YAN: 720 x 580 (Alt), 720 x 330 (Üst), 2100 x 580 (Boy)
-                - ALT-ÜST: (Genişlik-36) x (Derinlik-1) → 564x579, 664x579, vb.
-                - RAF Alt: (Genişlik-37) x (Derinlik-50) → 563x530, 663x530, vb.
-                - RAF Üst: (Genişlik-37) x (Derinlik-40) → 563x290, 663x290, vb.
-                - ARKALIK 8mm: (Yükseklik-18) x (Genişlik-18)
-                - KAYIT/KUŞAK: Bir kenar 80-140mm civarı
-                
-                Returns: (parça_tipi, kalınlık, boy, en)
-                """
-                olcu1 = row['OLCU1']
-                olcu2 = row['OLCU2']
-                kanalli = is_kanalli(row)
-                
-                # Malzeme kalınlığını veritabanından al
-                malzeme = row['MALZEME']
-                db_kalinlik = materials_db.get(malzeme, GOVDE_KALINLIK)
-                
-                # Ölçüleri sırala - büyük olan BOY, küçük olan EN
-                boy = max(olcu1, olcu2)
-                en = min(olcu1, olcu2)
-                
-                # ============================================================
-                # 0. ÖĞRENİLMİŞ PARÇA KONTROLÜ - En önce bak!
-                # ============================================================
-                learned_key = f"{boy}x{en}_{malzeme}"
-                if learned_key in learned_parts:
-                    learned_type = learned_parts[learned_key]
-                    # Kalınlık HER ZAMAN malzemenin veritabanındaki kalınlığı!
-                    return learned_type, db_kalinlik, boy, en
-                
-                # ============================================================
-                # 1. MALZEME KALINLIĞINA GÖRE TABLO BELİRLE
-                # 8mm ve altı → İnce (Arkalık) tablosu
-                # 8mm üstü → Gövde tablosu
-                # ============================================================
-                
-                # Arkalık (8mm ve altı) - Arkalık tiplerini kontrol et
-                if db_kalinlik <= ARKALIK_KALINLIK:
-                    return 'ARKALIK', db_kalinlik, boy, en
-                
-                # Çekmece yanı (16mm) - veritabanında 16mm olarak işaretli
-                if db_kalinlik == CEKMECE_YAN_KALINLIK:
-                    return 'ÇEKMECE YANI', db_kalinlik, boy, en
-                
-                # ============================================================
-                # 2. YAN KONTROLÜ - Standart yükseklik ve derinlik
-                # Alt dolap: 720 x 580
-                # Üst dolap: 720 x 330
-                # Boy dolap: 2100 x 580
-                # ============================================================
-                
-                # Üst dolap yanı: 720 x 330
-                if (abs(boy - 720) <= TOLERANS and abs(en - 330) <= TOLERANS):
-                    if kanalli:
-                        return 'YAN (KANALLI)', db_kalinlik, boy, en
-                    return 'YAN', db_kalinlik, boy, en
-                
-                # Alt dolap yanı: 720 x 580
-                if (abs(boy - 720) <= TOLERANS and abs(en - 580) <= TOLERANS):
-                    if kanalli:
-                        return 'YAN (KANALLI)', db_kalinlik, boy, en
-                    return 'YAN', db_kalinlik, boy, en
-                
-                # Boy dolap yanı: 2100 x 580
-                if (abs(boy - 2100) <= TOLERANS and abs(en - 580) <= TOLERANS):
-                    if kanalli:
-                        return 'YAN (KANALLI)', db_kalinlik, boy, en
-                    return 'YAN', db_kalinlik, boy, en
-                
-                # Özel derinlikli yan (custom_depths kullanılıyorsa)
-                if abs(boy - 720) <= TOLERANS or abs(boy - 2100) <= TOLERANS:
-                    # Yükseklik standart, derinlik kontrol
-                    if 300 <= en <= 600:  # Makul derinlik aralığı
-                        if kanalli:
-                            return 'YAN (KANALLI)', db_kalinlik, boy, en
-                        # Sadece standart derinliklere yakınsa YAN de
-                        if abs(en - 580) <= TOLERANS or abs(en - 330) <= TOLERANS:
-                            return 'YAN', db_kalinlik, boy, en
-                
-                # ============================================================
-                # 3. ALT-ÜST KONTROLÜ - (Genişlik-36) x (Derinlik-1)
-                # Tersine: Genişlik = BOY + 36
-                # EN değeri: 579 (580-1), 329 (330-1), vb.
-                # ============================================================
-                
-                # Alt dolap alt-üst: EN ≈ 579 (580-1)
-                if abs(en - 579) <= TOLERANS:
-                    # Modül genişliği = BOY + 36
-                    modul_gen = boy + 36
-                    if modul_gen % 50 <= TOLERANS or (50 - modul_gen % 50) <= TOLERANS:  # 50'nin katı (500, 550, 600, vb.)
-                        if kanalli:
-                            return 'ALT-ÜST (KANALLI)', db_kalinlik, boy, en
-                        return 'ALT-ÜST', db_kalinlik, boy, en
-                
-                # Üst dolap alt-üst: EN ≈ 329 (330-1)
-                if abs(en - 329) <= TOLERANS:
-                    modul_gen = boy + 36
-                    if modul_gen % 50 <= TOLERANS or (50 - modul_gen % 50) <= TOLERANS:
-                        if kanalli:
-                            return 'ALT-ÜST (KANALLI)', db_kalinlik, boy, en
-                        return 'ALT-ÜST', db_kalinlik, boy, en
-                
-                # Genel alt-üst kontrolü - EN değeri derinlik-1 olmalı
-                # 580-1=579, 330-1=329, veya özel derinlikler
-                possible_depths = [579, 329, 549, 529, 559]  # Yaygın derinlik-1 değerleri
-                for depth in possible_depths:
-                    if abs(en - depth) <= TOLERANS:
-                        if kanalli:
-                            return 'ALT-ÜST (KANALLI)', db_kalinlik, boy, en
-                        return 'ALT-ÜST', db_kalinlik, boy, en
-                
-                # ============================================================
-                # 4. RAF KONTROLÜ - (Genişlik-37) x (Derinlik-50 veya 40)
-                # RAF ASLA KANALLI OLMAZ!
-                # Alt dolap raf: EN ≈ 530 (580-50)
-                # Üst dolap raf: EN ≈ 290 (330-40)
-                # ============================================================
-                
-                if not kanalli:  # RAF ASLA KANALLI OLMAZ
-                    # Alt dolap rafı: EN ≈ 530
-                    if abs(en - 530) <= TOLERANS:
-                        modul_gen = boy + 37
-                        return 'RAF', db_kalinlik, boy, en
-                    
-                    # Üst dolap rafı: EN ≈ 290
-                    if abs(en - 290) <= TOLERANS:
-                        modul_gen = boy + 37
-                        return 'RAF (ÜST)', db_kalinlik, boy, en
-                    
-                    # Diğer olası raf derinlikleri (özel modüller için)
-                    # Derinlik-50 veya Derinlik-40 formülüne uyan değerler
-                    raf_depths_alt = [530, 520, 510, 500, 480, 450]  # Derinlik-50
-                    raf_depths_ust = [290, 280, 270, 260]  # Derinlik-40
-                    
-                    for raf_en in raf_depths_alt:
-                        if abs(en - raf_en) <= TOLERANS:
-                            return 'RAF', db_kalinlik, boy, en
-                    
-                    for raf_en in raf_depths_ust:
-                        if abs(en - raf_en) <= TOLERANS:
-                            return 'RAF (ÜST)', db_kalinlik, boy, en
-                
-                # ============================================================
-                # 5. KAYIT/KUŞAK KONTROLÜ - Bir kenar 80-140mm civarı
-                # ============================================================
-                
-                if 80 <= en <= 140:
-                    return 'KAYIT/KUŞAK', db_kalinlik, boy, en
-                
-                if 80 <= boy <= 140:
-                    return 'KAYIT/KUŞAK', db_kalinlik, boy, en
-                
-                # ============================================================
-                # 6. DİĞER - Hiçbir formüle uymayan
-                # Kalınlık her zaman malzemenin kalınlığı!
-                # ============================================================
-                
-                return 'DİĞER', db_kalinlik, boy, en
+        BELGE KURALLARI UYGULANIR:
+        - Kalınlıklar: 18mm (gövde), 16mm (çekmece yan), 8mm (arkalık)
+        - Parça formülleri belgeye göre
+        """
+        if not PANDAS_AVAILABLE:
+            return {'success': False, 'error': 'pandas kütüphanesi yüklü değil!'}
 
-            # ============================================================
-            # TÜM PARÇALARI İŞLE
-            # ============================================================
-            
-            results = []
-            for idx, row in df.iterrows():
-                parca_tipi, kalinlik, boy, en = determine_part_type(row)
-                
-                results.append({
-                    'POZ': row['POZ'],
-                    'MODÜL': row['MODUL_ADI'],
-                    'MODÜL TİPİ': row['MODUL_TIP'],
-                    'KALINLIK': kalinlik,
-                    'MALZEME': row['MALZEME'],
-                    'BOY': boy,
-                    'EN': en,
-                    'PARÇA TİPİ': parca_tipi,
-                    'ADET': row['ADET']
-                })
-            
-            result_df = pd.DataFrame(results)
-            
-            # ============================================================
-            # GRUPLAMA VE TOPLAMA
-            # ============================================================
-            
+        try:
+            settings = self.data_manager.get_settings()
+            materials_db = self.data_manager.get_materials()
+            learned_rows = self.data_manager.get_learned_parts_rows()
+
+            # Büyük xlsx girdilerinde tüm tabloyu belleğe kurmak yerine
+            # batch'ler halinde akıt; tepe bellek O(batch + grup sayısı)
+            # olur. Küçük dosyalar önbellekli tek parça okunmaya devam eder.
+            streaming = (file_path.lower().endswith(('.xlsx', '.xlsm'))
+                         and os.path.getsize(file_path) > self._STREAM_SIZE_BYTES)
+            if streaming:
+                batches = _iter_row_batches(file_path, self._STREAM_BATCH_ROWS)
+            else:
+                batches = iter([self._read_frame_cached(file_path)])
+
+            col_map = None
+            job_no = None
+            keep_cols = None
+            partials = []
+            for df in batches:
+                # Sütun mapping ve job number ilk batch'ten
+                if col_map is None:
+                    col_map = self._get_column_mapping(df)
+                    # Çalışma kümesini mapping'in kullandığı sütunlara indir
+                    # (xlsx akış okuyucusu zaten budar; CSV ve tanınmayan
+                    # uzantılar için burada yapılır). Şema eksikse konuma
+                    # dayalı fallback'ler bozulmasın diye dokunma.
+                    if {'olcu1', 'olcu2', 'malzeme'} <= col_map.keys():
+                        needed = set(col_map.values())
+                        keep_cols = [c for c in df.columns if c in needed]
+                if job_no is None and '§542 Info16' in df.columns:
+                    info16_values = df['§542 Info16'].dropna().unique()
+                    if len(info16_values) > 0:
+                        job_no = str(info16_values[0]).strip()
+                if df.empty:
+                    continue
+                if keep_cols is not None and len(keep_cols) < df.shape[1]:
+                    df = df[keep_cols]
+                partials.append(self._summarize_frame(df, col_map, settings,
+                                                      materials_db, learned_rows))
+
+            # Kısmi özetleri birleştir ve grupları tekrar topla
             group_cols = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ']
-            summary = result_df.groupby(group_cols).agg({'ADET': 'sum'}).reset_index()
-            
+            if len(partials) == 1:
+                summary = partials[0]
+            elif partials:
+                summary = pd.concat(partials, ignore_index=True)
+                summary = summary.groupby(group_cols, observed=True,
+                                          as_index=False)['ADET'].sum()
+            else:
+                summary = pd.DataFrame(columns=group_cols + ['ADET'])
+
+            # Downstream (JSON geçmişi, openpyxl) baseline int64 bekliyor;
+            # özet küçük olduğu için geri genişletmek ucuz
+            for col in ('KALINLIK', 'BOY', 'EN', 'ADET'):
+                summary[col] = summary[col].astype('int64')
+
             # Kalınlığa göre 3 tabloya ayır (18mm, 16mm, 8mm)
             df_18mm = summary[summary['KALINLIK'] == 18].copy()
             df_16mm = summary[summary['KALINLIK'] == 16].copy()
             df_8mm = summary[summary['KALINLIK'] <= 8].copy()
             
             # PARÇA TİPİ'ne göre sırala - aynı tipler alt alta gelsin
-            part_type_order = [
-                'YAN', 'YAN (K)',
-                'ALT-ÜST', 'ALT-ÜST (K)',
-                'SABİT', 'SABİT (K)',
-                'RAF', 'RAF (K)',
-                'RAF (ÜST)', 'RAF (ÜST) (K)',
-                'KAYIT/KUŞAK', 'KAYIT/KUŞAK (K)',
-                'ÇEKMECE YANI', 'ÇEKMECE YANI (K)',
-                'ARKALIK', 'ARKALIK (K)',
-                'ARKALIK (İÇERDE)', 'ARKALIK (İÇERDE) (K)',
-                'DİĞER', 'DİĞER (K)'
-            ]
-            
             def sort_by_part_type(df):
                 if df.empty or 'PARÇA TİPİ' not in df.columns:
                     return df
-                df['_sort_order'] = df['PARÇA TİPİ'].apply(
-                    lambda x: part_type_order.index(x) if x in part_type_order else 999
-                )
+                df['_sort_order'] = df['PARÇA TİPİ'].map(_PART_TYPE_RANK).fillna(999).astype('int16')
                 df = df.sort_values(by=['_sort_order', 'MALZEME', 'BOY', 'EN'])
                 df = df.drop(columns=['_sort_order'])
                 return df
-            
+
             df_18mm = sort_by_part_type(df_18mm)
             df_16mm = sort_by_part_type(df_16mm)
             df_8mm = sort_by_part_type(df_8mm)
 
 
-            # ============================================================
-            # EXCEL'E YAZI - TEK SHEET'TE 3 TABLO YAN YANA
-            # ============================================================
-            
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-            
-            workbook = Workbook()
-            worksheet = workbook.active
-            worksheet.title = 'Kesim Listesi'
-            
-            # Stil tanımları - 3 farklı renk
-            header_font = Font(bold=True, color='FFFFFF')
-            header_fill_18mm = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')  # Mavi
-            header_fill_16mm = PatternFill(start_color='8B5CF6', end_color='8B5CF6', fill_type='solid')  # Mor
-            header_fill_8mm = PatternFill(start_color='70AD47', end_color='70AD47', fill_type='solid')   # Yeşil
-            title_font = Font(bold=True, size=14)
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
-            # Sütun sıralaması
-            column_order = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ', 'ADET']
-            
-            # DataFrame'leri sütun sırasına göre düzenle
-            for df in [df_18mm, df_16mm, df_8mm]:
-                if not df.empty:
-                    cols = [c for c in column_order if c in df.columns]
-                    df = df[cols]
-            
-            # Sabit sütun sayısı
-            cols_count = 6
-            table_gap = 1  # Tablolar arası boşluk
-            
-            def write_table(ws, start_col, df, title, header_fill):
-                """Tek bir tabloyu belirtilen sütundan başlayarak yaz"""
-                current_row = 1
-                
-                # Zebra efekti için gri renk
-                gray_fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
-                
-                # Başlık - ORTALI
-                ws.cell(row=current_row, column=start_col, value=title)
-                ws.cell(row=current_row, column=start_col).font = title_font
-                ws.cell(row=current_row, column=start_col).alignment = Alignment(horizontal='center')
-                if cols_count > 1:
-                    ws.merge_cells(start_row=current_row, start_column=start_col, 
-                                  end_row=current_row, end_column=start_col + cols_count - 1)
-                
-                current_row += 1
-                
-                # Header satırı
-                header_names = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ', 'ADET']
-                for col_idx, col_name in enumerate(header_names):
-                    cell = ws.cell(row=current_row, column=start_col + col_idx, value=col_name)
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = Alignment(horizontal='center')
-                    cell.border = thin_border
-                
-                current_row += 1
-                
-                # Veri satırları - ZEBRA EFEKTİ (beyaz/gri)
-                if not df.empty:
-                    # DataFrame sütunlarını sırala
-                    df_ordered = df.copy()
-                    existing_cols = [c for c in column_order if c in df_ordered.columns]
-                    df_ordered = df_ordered[existing_cols]
-                    
-                    row_index = 0
-                    for row_data in df_ordered.values:
-                        for col_idx, value in enumerate(row_data):
-                            cell = ws.cell(row=current_row, column=start_col + col_idx, value=value)
-                            cell.border = thin_border
-                            cell.alignment = Alignment(horizontal='center')
-                            # Çift satırlar gri (0, 2, 4...), tek satırlar beyaz
-                            if row_index % 2 == 1:
-                                cell.fill = gray_fill
-                        current_row += 1
-                        row_index += 1
-                else:
-                    ws.cell(row=current_row, column=start_col, value='(Veri yok)')
-                    current_row += 1
-                
-                return current_row
-            
-            # ========== 1. TABLO: 18mm PARÇALAR (Mavi) ==========
-            col_18mm_start = 1
-            write_table(worksheet, col_18mm_start, df_18mm, '18mm Parçalar', header_fill_18mm)
-            
-            # ========== 2. TABLO: 16mm PARÇALAR (Mor) ==========
-            col_16mm_start = col_18mm_start + cols_count + table_gap
-            write_table(worksheet, col_16mm_start, df_16mm, '16mm Parçalar', header_fill_16mm)
-            
-            # ========== 3. TABLO: 8mm PARÇALAR (Yeşil) ==========
-            col_8mm_start = col_16mm_start + cols_count + table_gap
-            write_table(worksheet, col_8mm_start, df_8mm, '8mm Parçalar', header_fill_8mm)
-            
-            # Sütun genişliklerini ayarla
-            # Sütun sırası: KALINLIK, MALZEME, BOY, EN, PARÇA TİPİ, ADET
-            # 18mm ve 16mm için genişlikler
-            widths_normal = [9, None, 9.5, 9.5, 14.2, 9]  # None = otomatik
-            # 8mm için genişlikler (PARÇA TİPİ farklı)
-            widths_8mm = [9, None, 9.5, 9.5, 15.7, 9]
-            
-            def set_column_widths(start_col, df, widths):
-                for i, width in enumerate(widths):
-                    col_letter = get_column_letter(start_col + i)
-                    if width is None:
-                        # Otomatik: içeriğe göre ayarla
-                        max_len = len('MALZEME')  # Header uzunluğu
-                        if not df.empty and 'MALZEME' in df.columns:
-                            max_content = df['MALZEME'].astype(str).str.len().max()
-                            max_len = max(max_len, max_content)
-                        worksheet.column_dimensions[col_letter].width = max_len + 2
+            # Excel dosyasına yaz - xlsxwriter kuruluysa hızlı akışlı
+            # yazıcı, yoksa openpyxl
+            if XLSXWRITER_AVAILABLE:
+                _export_summary_xlsxwriter(output_path, df_18mm, df_16mm, df_8mm)
+            else:
+                # ============================================================
+                # EXCEL'E YAZI - TEK SHEET'TE 3 TABLO YAN YANA
+                # write-only mod: hücre nesneleri bellekte tutulmaz, satırlar
+                # doğrudan XML akışına yazılır; stil nesneleri paylaşılır
+                # ============================================================
+
+                from openpyxl import Workbook
+                from openpyxl.cell import WriteOnlyCell
+                from openpyxl.utils import get_column_letter
+
+                workbook = Workbook(write_only=True)
+                worksheet = workbook.create_sheet('Kesim Listesi')
+
+                # Stil tanımları - modül genelinde bir kez kurulup paylaşılır
+                styles = _get_xlsx_styles()
+                header_font = styles['header_font']
+                header_fill_18mm = styles['header_fill_18mm']
+                header_fill_16mm = styles['header_fill_16mm']
+                header_fill_8mm = styles['header_fill_8mm']
+                title_font = styles['title_font']
+                thin_border = styles['thin_border']
+                center = styles['center']
+                # Zebra efekti veri hücrelerinde NamedStyle ile (tek atama)
+                workbook.add_named_style(styles['plain_data_style'])
+                workbook.add_named_style(styles['zebra_data_style'])
+
+                # Sütun sıralaması ve yerleşim
+                column_order = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ', 'ADET']
+                cols_count = 6
+                table_gap = 1  # Tablolar arası boşluk
+
+                # Tablolar: (veri satırları, başlık, header rengi, df)
+                tables = []
+                for tbl_df, title, fill in ((df_18mm, '18mm Parçalar', header_fill_18mm),
+                                            (df_16mm, '16mm Parçalar', header_fill_16mm),
+                                            (df_8mm, '8mm Parçalar', header_fill_8mm)):
+                    if tbl_df.empty:
+                        data_rows = []
                     else:
-                        worksheet.column_dimensions[col_letter].width = width
-            
-            set_column_widths(col_18mm_start, df_18mm, widths_normal)
-            set_column_widths(col_16mm_start, df_16mm, widths_normal)
-            set_column_widths(col_8mm_start, df_8mm, widths_8mm)
-            
+                        cols = [c for c in column_order if c in tbl_df.columns]
+                        data_rows = list(tbl_df[cols].itertuples(index=False, name=None))
+                    tables.append((data_rows, title, fill, tbl_df))
+
+                # Sütun genişlikleri - write-only modda satırlar eklenmeden önce
+                widths_normal = [9, None, 9.5, 9.5, 14.2, 9]  # None = otomatik
+                widths_8mm = [9, None, 9.5, 9.5, 15.7, 9]
+                start_col = 1
+                for (data_rows, title, fill, tbl_df), widths in zip(
+                        tables, (widths_normal, widths_normal, widths_8mm)):
+                    for i, width in enumerate(widths):
+                        col_letter = get_column_letter(start_col + i)
+                        if width is None:
+                            # Otomatik: benzersiz değerler üzerinden
+                            # O(#unique) içerik uzunluğu
+                            max_len = len('MALZEME')
+                            if not tbl_df.empty and 'MALZEME' in tbl_df.columns:
+                                uniq = pd.Index(tbl_df['MALZEME'].unique()).astype(str)
+                                if len(uniq):
+                                    max_len = max(max_len, int(uniq.str.len().max()))
+                            worksheet.column_dimensions[col_letter].width = max_len + 2
+                        else:
+                            worksheet.column_dimensions[col_letter].width = width
+                    start_col += cols_count + table_gap
+
+                # Başlık satırı - ORTALI, tablo genişliğince birleştirilmiş
+                title_row = []
+                start_col = 1
+                for data_rows, title, fill, tbl_df in tables:
+                    cell = WriteOnlyCell(worksheet, value=title)
+                    cell.font = title_font
+                    cell.alignment = center
+                    title_row.extend([cell] + [None] * (cols_count + table_gap - 1))
+                    worksheet.merged_cells.ranges.add(
+                        f'{get_column_letter(start_col)}1:{get_column_letter(start_col + cols_count - 1)}1')
+                    start_col += cols_count + table_gap
+                worksheet.append(title_row[:-table_gap])
+
+                # Header satırı
+                header_row = []
+                for data_rows, title, fill, tbl_df in tables:
+                    for name in column_order:
+                        cell = WriteOnlyCell(worksheet, value=name)
+                        cell.font = header_font
+                        cell.fill = fill
+                        cell.alignment = center
+                        cell.border = thin_border
+                        header_row.append(cell)
+                    header_row.append(None)
+                worksheet.append(header_row[:-1])
+
+                # Veri satırları - üç tablo tek satır akışında, ZEBRA EFEKTİ
+                max_rows = max((len(data_rows) for data_rows, _, _, _ in tables), default=0)
+                for r in range(max_rows):
+                    data_style = 'zebra_data' if r % 2 == 1 else 'plain_data'
+                    out = []
+                    for data_rows, title, fill, tbl_df in tables:
+                        if r < len(data_rows):
+                            for value in data_rows[r]:
+                                cell = WriteOnlyCell(worksheet, value=value)
+                                cell.style = data_style
+                                out.append(cell)
+                        elif r == 0:
+                            out.append(WriteOnlyCell(worksheet, value='(Veri yok)'))
+                            out.extend([None] * (cols_count - 1))
+                        else:
+                            out.extend([None] * cols_count)
+                        out.append(None)
+                    worksheet.append(out[:-1])
+                if max_rows == 0:
+                    # Üç tablo da boş - yine de '(Veri yok)' satırı yaz
+                    out = []
+                    for _ in tables:
+                        out.append(WriteOnlyCell(worksheet, value='(Veri yok)'))
+                        out.extend([None] * (cols_count + table_gap - 1))
+                    worksheet.append(out[:-table_gap])
+
+                # Excel dosyasını kaydet
+                workbook.save(output_path)
+
             # İstatistikler
             govde_18 = int(df_18mm['ADET'].sum()) if not df_18mm.empty else 0
             cekmece_16 = int(df_16mm['ADET'].sum()) if not df_16mm.empty else 0
             arkalik_8 = int(df_8mm['ADET'].sum()) if not df_8mm.empty else 0
-            
-            # Excel dosyasını kaydet
-            workbook.save(output_path)
 
             # ============================================================
             # SONUÇ DÖNDÜR
@@ -1381,7 +1942,7 @@ class ExcelAnalyzer:
                 'output_path': output_path,
                 'job_no': job_no,
                 'total_parts': int(summary['ADET'].sum()),
-                'material_count': len(result_df['MALZEME'].unique()),
+                'material_count': len(summary['MALZEME'].unique()),
                 'type_count': len(summary['PARÇA TİPİ'].unique()),
                 'thickness_summary': {
                     'govde_18': govde_18,
@@ -1394,7 +1955,6 @@ class ExcelAnalyzer:
             }
             
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {'success': False, 'error': str(e)}
 
@@ -1410,10 +1970,7 @@ class ExcelAnalyzer:
 
         try:
             # Dosyayı oku
-            if file_path.lower().endswith('.csv'):
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
+            df = self._read_frame_cached(file_path)
 
             settings = self.data_manager.get_settings()
             materials_db = self.data_manager.get_materials()
@@ -1421,6 +1978,10 @@ class ExcelAnalyzer:
             
             col_map = self._get_column_mapping(df)
 
+            # Sütun adları bir kez stringe çevrilir; aşağıdaki geri düşüş
+            # taramaları tekrar tekrar str(col) üretmesin
+            col_names = [(col, str(col)) for col in df.columns]
+
             # Job number - Info16'dan al
             job_no = None
             info16_col = col_map.get('info16')
@@ -1428,11 +1989,11 @@ class ExcelAnalyzer:
                 info16_values = df[info16_col].dropna().unique()
                 if len(info16_values) > 0:
                     job_no = str(info16_values[0]).strip()
-            
+
             # Alternatif Info16 arama
             if not job_no:
-                for col in df.columns:
-                    if 'Info16' in str(col):
+                for col, name in col_names:
+                    if 'Info16' in name:
                         info16_values = df[col].dropna().unique()
                         if len(info16_values) > 0:
                             job_no = str(info16_values[0]).strip()
@@ -1454,11 +2015,11 @@ class ExcelAnalyzer:
             # Ölçü sütunlarını kontrol et
             if olcu1_col not in df.columns:
                 # Uzunluk sütununu bul
-                for col in df.columns:
-                    if 'Uzunluk' in str(col):
+                for col, name in col_names:
+                    if 'Uzunluk' in name:
                         olcu1_col = col
                         break
-            
+
             # İkinci ölçü sütunu (parça eni)
             olcu2_col = col_map.get('olcu2')
             if not olcu2_col or olcu2_col not in df.columns:
@@ -1467,229 +2028,202 @@ class ExcelAnalyzer:
                 if olcu1_col in columns:
                     olcu1_idx = columns.index(olcu1_col)
                     for i in range(olcu1_idx + 1, min(olcu1_idx + 3, len(columns))):
-                        col = columns[i]
-                        if 'Info' not in str(col) and 'Malzeme' not in str(col):
+                        col, name = col_names[i]
+                        if 'Info' not in name and 'Malzeme' not in name:
                             olcu2_col = col
                             break
             
             print(f"Ölçü sütunları: olcu1={olcu1_col}, olcu2={olcu2_col}")
             
-            df['OLCU1'] = pd.to_numeric(df[olcu1_col], errors='coerce').fillna(0).astype(int) if olcu1_col in df.columns else 0
-            df['OLCU2'] = pd.to_numeric(df[olcu2_col], errors='coerce').fillna(0).astype(int) if olcu2_col and olcu2_col in df.columns else 0
+            df['OLCU1'] = _coerce_int32(df[olcu1_col]) if olcu1_col in df.columns else 0
+            df['OLCU2'] = _coerce_int32(df[olcu2_col]) if olcu2_col and olcu2_col in df.columns else 0
             df['MALZEME'] = df[malzeme_col].fillna('').astype(str).str.strip() if malzeme_col in df.columns else ''
             
             # ADET sütununu Excel'den oku (Sipariş sütunu)
             adet_col = col_map.get('adet')
             if adet_col and adet_col in df.columns:
-                df['ADET'] = pd.to_numeric(df[adet_col], errors='coerce').fillna(1).astype(int)
+                df['ADET'] = _coerce_int32(df[adet_col], fill=1)
                 print(f"ADET sütunu bulundu: {adet_col}")
             else:
                 df['ADET'] = 1
                 print("ADET sütunu bulunamadı, varsayılan 1 kullanılıyor")
 
-            # Modül adından genişlik çıkarma fonksiyonu
-            def get_modul_genislik(modul_adi: str) -> int:
-                """Modül adından genişlik çıkar (cm → mm)"""
-                if not modul_adi or pd.isna(modul_adi):
-                    return None
-                modul_adi = str(modul_adi).lower()
-                cm_match = re.search(r'(\d+)\s*cm', modul_adi)
-                if cm_match:
-                    return int(cm_match.group(1)) * 10  # cm → mm
-                return None
-
-            # Kanallı kontrol fonksiyonu
-            def check_kanalli(row) -> bool:
-                if not kanalli_col or kanalli_col not in df.columns:
-                    return False
-                kanalli_val = str(row.get(kanalli_col, '')).upper().strip()
-                if kanalli_val in ['TRUE', 'EVET', 'YES', '1', 'VAR']:
-                    return True
-                if re.search(r'(SOL|SAĞ|SAG)_\d+\+\d+', kanalli_val):
-                    return True
-                return False
-
-            def determine_part_type_with_module(row) -> tuple:
-                """
-                Parça tipini belirle - modül genişliğini ve özel modül ayarlarını dikkate alarak.
-                
-                KRİTİK: Kalınlık her zaman malzemenin veritabanındaki kalınlığından (db_kalinlik) alınır!
-                Parça tipi ölçülere göre belirlenir ama kalınlık malzemeye göre belirlenir.
-                
-                Returns: (parça_tipi, kalınlık, boy, en, kanalli)
-                """
-                olcu1, olcu2 = row['OLCU1'], row['OLCU2']
-                malzeme = row['MALZEME']
-                kanalli = check_kanalli(row)
-                db_kalinlik = materials_db.get(malzeme, GOVDE_KALINLIK)
-                
-                boy = max(olcu1, olcu2)
-                en = min(olcu1, olcu2)
-                
-                # POZ'u al ve özel modül ayarlarını kontrol et
-                poz = str(row.get(poz_col, '')).strip() if poz_col and poz_col in df.columns else ''
-                custom_module = self._get_custom_module_for_poz(poz) if poz else None
-                
-                # Modül adını al ve dolap tipini tespit et
-                modul_adi = row.get(modul_col, '') if modul_col and modul_col in df.columns else ''
-                modul_adi_str = str(modul_adi).lower() if modul_adi else ''
-                
-                # Dolap tipini belirle: üst, alt, boy
-                if 'üst' in modul_adi_str or 'ust' in modul_adi_str:
-                    dolap_tipi = 'ust'
-                elif 'boy' in modul_adi_str:
-                    dolap_tipi = 'boy'
-                else:
-                    dolap_tipi = 'alt'
-                
-                # Modül genişliğini al - önce özel ayarlardan, yoksa modül adından
-                if custom_module and custom_module.get('genislik'):
-                    modul_gen = custom_module.get('genislik')
-                else:
-                    modul_gen = get_modul_genislik(modul_adi)
-                
-                # ============================================================
-                # ÖLÇÜLERİ BELİRLE - ÖNCELİK SIRASI:
-                # 1. POZ-spesifik özel modül ayarları (custom_module)
-                # 2. Toplu dolap tipi ayarları (cabinet_settings)
-                # 3. Varsayılan değerler
-                # ============================================================
-                
-                # Önce POZ-spesifik ayarları kontrol et
-                if custom_module:
-                    custom_yukseklik = custom_module.get('yukseklik')
-                    custom_derinlik = custom_module.get('derinlik')
-                else:
-                    custom_yukseklik = None
-                    custom_derinlik = None
-                
-                # Toplu dolap ayarlarından değerleri al
-                cabinet = self.cabinet_settings.get(dolap_tipi, {'yukseklik': 720, 'derinlik': 580})
-                
-                # Final yükseklik ve derinlik - POZ ayarı öncelikli, yoksa cabinet ayarı
-                yukseklik = custom_yukseklik if custom_yukseklik else cabinet.get('yukseklik', 720)
-                derinlik = custom_derinlik if custom_derinlik else cabinet.get('derinlik', 580)
-                
-                # Öğrenilmiş parça kontrolü (kanallı dahil key)
-                learned_key = f"{boy}x{en}_{malzeme}"
-                if learned_key in learned_parts:
-                    learned_type = learned_parts[learned_key]
-                    # Öğrenilmiş tip ne olursa olsun, kalınlık malzemenin kalınlığı!
-                    return learned_type, db_kalinlik, boy, en, kanalli
-                
-                # ============================================================
-                # ÖNCELİK: Malzeme kalınlığına göre genel tip belirle
-                # Eğer malzeme 8mm ise → tip tespiti arkalık odaklı
-                # Eğer malzeme 18mm ise → tip tespiti gövde odaklı
-                # ============================================================
-                
-                # Malzeme 8mm (ince) ise - arkalık tipleri kontrol et
-                if db_kalinlik <= ARKALIK_KALINLIK:
-                    # Normal ARKALIK: (Yükseklik-18) x (Genişlik-18)
-                    if modul_gen:
-                        expected_arkalik_boy = yukseklik - 18
-                        expected_arkalik_en = modul_gen - 18
-                        if abs(boy - expected_arkalik_boy) <= TOLERANS and abs(en - expected_arkalik_en) <= TOLERANS:
-                            return 'ARKALIK', db_kalinlik, boy, en, kanalli
-                        
-                        # ARKALIK (İÇERDE): (Yükseklik-37) x (Genişlik-37)
-                        expected_arkalik_icerde_boy = yukseklik - 37
-                        expected_arkalik_icerde_en = modul_gen - 37
-                        if abs(boy - expected_arkalik_icerde_boy) <= TOLERANS and abs(en - expected_arkalik_icerde_en) <= TOLERANS:
-                            return 'ARKALIK (İÇERDE)', db_kalinlik, boy, en, kanalli
-                    
-                    # Genel arkalık (modül genişliği bilinmiyorsa)
-                    return 'ARKALIK', db_kalinlik, boy, en, kanalli
-                
-                # ============================================================
-                # PARÇA TİPİ TESPİTİ - yukseklik ve derinlik değerlerini kullan
-                # (cabinet_settings veya custom_module'den alındı)
-                # ============================================================
-                
-                # YAN kontrolü - Yükseklik x Derinlik
-                if abs(boy - yukseklik) <= TOLERANS and abs(en - derinlik) <= TOLERANS:
-                    return 'YAN', db_kalinlik, boy, en, kanalli
-                
-                # ALT-ÜST: (Genişlik-36) x (Derinlik-1)
-                if modul_gen:
-                    expected_alt_ust_boy = modul_gen - 36
-                    expected_alt_ust_en = derinlik - 1
-                    
-                    if abs(boy - expected_alt_ust_boy) <= TOLERANS and abs(en - expected_alt_ust_en) <= TOLERANS:
-                        return 'ALT-ÜST', db_kalinlik, boy, en, kanalli
-                
-                # SABİT: (Genişlik-36) x (Derinlik-23)
-                if modul_gen:
-                    expected_sabit_boy = modul_gen - 36
-                    expected_sabit_en = derinlik - 23
-                    
-                    if abs(boy - expected_sabit_boy) <= TOLERANS and abs(en - expected_sabit_en) <= TOLERANS:
-                        return 'SABİT', db_kalinlik, boy, en, kanalli
-                
-                # RAF: (Genişlik-37) x (Derinlik-50 veya 40)
-                # RAF ASLA KANALLI OLMAZ
-                if modul_gen and not kanalli:
-                    expected_raf_boy = modul_gen - 37
-                    
-                    # Dolap tipine göre raf düşümü: alt=50, üst=40
-                    raf_dusum = 50 if dolap_tipi == 'alt' or dolap_tipi == 'boy' else 40
-                    expected_raf_en = derinlik - raf_dusum
-                    
-                    if abs(boy - expected_raf_boy) <= TOLERANS and abs(en - expected_raf_en) <= TOLERANS:
-                        if dolap_tipi == 'ust':
-                            return 'RAF (ÜST)', db_kalinlik, boy, en, kanalli
-                        else:
-                            return 'RAF', db_kalinlik, boy, en, kanalli
-                
-                # ============================================================
-                # MODÜL GENİŞLİĞİ YOKSA - SABİT ÖLÇÜLERLE KONTROL
-                # ============================================================
-                
-                # ALT-ÜST kontrolü - EN değeri 579 veya 329 civarı
-                if abs(en - 579) <= TOLERANS or abs(en - 329) <= TOLERANS:
-                    return 'ALT-ÜST', db_kalinlik, boy, en, kanalli
-                
-                # SABİT kontrolü - EN değeri 557 veya 307 civarı
-                if abs(en - 557) <= TOLERANS or abs(en - 307) <= TOLERANS:
-                    return 'SABİT', db_kalinlik, boy, en, kanalli
-                
-                # RAF kontrolü - RAF ASLA KANALLI OLMAZ
-                if not kanalli:
-                    if abs(en - 530) <= TOLERANS:
-                        return 'RAF', db_kalinlik, boy, en, kanalli
-                    if abs(en - 290) <= TOLERANS:
-                        return 'RAF (ÜST)', db_kalinlik, boy, en, kanalli
-                
-                # KAYIT/KUŞAK - Bir kenar 80-140mm civarı
-                if 80 <= en <= 140 or 80 <= boy <= 140:
-                    return 'KAYIT/KUŞAK', db_kalinlik, boy, en, kanalli
-                
-                # DİĞER - Hiçbirine uymayan
-                return 'DİĞER', db_kalinlik, boy, en, kanalli
+            # ============================================================
+            # PARÇA TİPİ BELİRLEME - vektörize
+            #
+            # determine_part_type_with_module'un kolon bazlı karşılığı:
+            # kurallar satır döngüsü yerine maskelerle uygulanır; np.select
+            # ilk uyan kuralı seçtiği için if-zincirinin öncelik sırası
+            # birebir korunur. Kalınlık her zaman malzemenin veritabanındaki
+            # kalınlığıdır.
+            #
+            # Not: Numba @njit ile ayrı bir çekirdek denendi ama eklenmedi;
+            # numba dağıtım bağımlılıklarımızda yok ve tek geçişli maske
+            # hattı tipik iş boyutlarında (<100k satır) zaten milisaniye
+            # mertebesinde. (Numba tried but not adopted: not a deployment
+            # dependency, and the single-pass mask pipeline is already
+            # fast enough at typical job sizes.)
+            # ============================================================
 
-            # Parçaları işle - KANALLI bilgisini de ekle
-            results = []
-            for idx, row in df.iterrows():
-                parca_tipi, kalinlik, boy, en, kanalli = determine_part_type_with_module(row)
-                results.append({
-                    'KALINLIK': kalinlik,
-                    'MALZEME': row['MALZEME'],
-                    'BOY': boy,
-                    'EN': en,
-                    'PARÇA TİPİ': parca_tipi,
-                    'KANALLI': kanalli,  # Kanallı bilgisi eklendi
-                    'ADET': row['ADET']
-                })
-            
-            result_df = pd.DataFrame(results)
-            
-            # Gruplama - KANALLI bilgisini de dahil et
+            olcu1 = df['OLCU1'].to_numpy()
+            olcu2 = df['OLCU2'].to_numpy()
+
+            # Ölçüleri sırala - büyük olan BOY, küçük olan EN
+            boy = np.maximum(olcu1, olcu2)
+            en = np.minimum(olcu1, olcu2)
+
+            db_kalinlik = df['MALZEME'].map(materials_db).fillna(GOVDE_KALINLIK).astype(int).to_numpy()
+
+            # Kanallı tespiti - kolon üzerinde tek tarama
+            if kanalli_col and kanalli_col in df.columns:
+                kv = df[kanalli_col].astype(str).str.upper().str.strip().str.translate(TR_FOLD)
+                kanalli_arr = (
+                    kv.isin(['TRUE', 'EVET', 'YES', '1', 'VAR'])
+                    | kv.str.contains(_KANAL_RE, na=False)
+                ).to_numpy()
+            else:
+                kanalli_arr = np.zeros(len(df), dtype=bool)
+
+            # Modül adından dolap tipi (0=alt, 1=ust, 2=boy) ve genişlik
+            if modul_col and modul_col in df.columns:
+                modul_low = df[modul_col].fillna('').astype(str).str.translate(TR_FOLD).str.lower()
+            else:
+                modul_low = pd.Series([''] * len(df), index=df.index)
+            is_ust = modul_low.str.contains('ust', regex=False, na=False).to_numpy(dtype=bool)
+            is_boy = modul_low.str.contains('boy', regex=False, na=False).to_numpy(dtype=bool)
+            tipi = np.select([is_ust, is_boy], [1, 2], default=0)
+
+            # Genişlik modül adından (cm → mm); POZ'a özel ayar öncelikli
+            gen_name = pd.to_numeric(modul_low.str.extract(_CM_RE, expand=False),
+                                     errors='coerce') * 10
+
+            if poz_col and poz_col in df.columns:
+                poz_s = df[poz_col].fillna('').astype(str).str.strip()
+            else:
+                poz_s = pd.Series([''] * len(df), index=df.index)
+            if self.custom_modules:
+                cm = self.custom_modules
+                custom_gen = pd.to_numeric(poz_s.map({p: m.get('genislik') for p, m in cm.items()}), errors='coerce')
+                custom_yuk = pd.to_numeric(poz_s.map({p: m.get('yukseklik') for p, m in cm.items()}), errors='coerce')
+                custom_der = pd.to_numeric(poz_s.map({p: m.get('derinlik') for p, m in cm.items()}), errors='coerce')
+            else:
+                custom_gen = custom_yuk = custom_der = pd.Series(np.nan, index=df.index)
+
+            modul_gen = custom_gen.where(custom_gen > 0, gen_name).to_numpy(dtype=float)
+
+            # Dolap tipine göre yükseklik/derinlik LUT; POZ ayarı öncelikli
+            yuk_lut = np.empty(3)
+            der_lut = np.empty(3)
+            for t_id, t_name in enumerate(('alt', 'ust', 'boy')):
+                cab = self.cabinet_settings.get(t_name, {'yukseklik': 720, 'derinlik': 580})
+                yuk_lut[t_id] = cab.get('yukseklik', 720)
+                der_lut[t_id] = cab.get('derinlik', 580)
+            custom_yuk_arr = custom_yuk.to_numpy(dtype=float)
+            custom_der_arr = custom_der.to_numpy(dtype=float)
+            yukseklik = np.where(custom_yuk_arr > 0, custom_yuk_arr, yuk_lut[tipi])
+            derinlik = np.where(custom_der_arr > 0, custom_der_arr, der_lut[tipi])
+
+            # Öğrenilmiş parça kontrolü (kanallı dahil key)
+            if learned_parts:
+                keys = (pd.Series(boy.astype(str), index=df.index) + 'x'
+                        + pd.Series(en.astype(str), index=df.index) + '_'
+                        + df['MALZEME'].astype(str))
+                learned_s = keys.map(learned_parts)
+            else:
+                learned_s = pd.Series([None] * len(df), index=df.index, dtype=object)
+            learned_mask = learned_s.notna().to_numpy()
+
+            # Kural maskeleri - NaN içeren karşılaştırmalar False verir,
+            # bu yüzden modül genişliği bilinmeyen satırlar gen'li kuralları
+            # kendiliğinden atlar (orijinal 'if modul_gen:' davranışı)
+            tol = TOLERANS
+            thin_mask = db_kalinlik <= ARKALIK_KALINLIK
+
+            # Malzeme 8mm (ince) ise - arkalık tipleri
+            ark_norm = thin_mask & (np.abs(boy - (yukseklik - 18)) <= tol) & (np.abs(en - (modul_gen - 18)) <= tol)
+            ark_icer = thin_mask & (np.abs(boy - (yukseklik - 37)) <= tol) & (np.abs(en - (modul_gen - 37)) <= tol)
+
+            # YAN kontrolü - Yükseklik x Derinlik
+            yan = (np.abs(boy - yukseklik) <= tol) & (np.abs(en - derinlik) <= tol)
+
+            # Modül genişliği bilinen formüller
+            altust_gen = (np.abs(boy - (modul_gen - 36)) <= tol) & (np.abs(en - (derinlik - 1)) <= tol)
+            sabit_gen = (np.abs(boy - (modul_gen - 36)) <= tol) & (np.abs(en - (derinlik - 23)) <= tol)
+            # RAF ASLA KANALLI OLMAZ; raf düşümü alt/boy=50, üst=40
+            raf_dusum = np.where(tipi == 1, 40, 50)
+            raf_gen = ~kanalli_arr & (np.abs(boy - (modul_gen - 37)) <= tol) & (np.abs(en - (derinlik - raf_dusum)) <= tol)
+
+            # Modül genişliği yoksa - sabit ölçülerle kontrol
+            altust_fix = (np.abs(en - 579) <= tol) | (np.abs(en - 329) <= tol)
+            sabit_fix = (np.abs(en - 557) <= tol) | (np.abs(en - 307) <= tol)
+            raf_fix = ~kanalli_arr & (np.abs(en - 530) <= tol)
+            raf_ust_fix = ~kanalli_arr & (np.abs(en - 290) <= tol)
+
+            # KAYIT/KUŞAK - Bir kenar 80-140mm civarı
+            kayit = ((en >= 80) & (en <= 140)) | ((boy >= 80) & (boy <= 140))
+
+            parca_tipi = np.select(
+                [
+                    learned_mask,
+                    ark_norm,
+                    ark_icer,
+                    thin_mask,
+                    yan,
+                    altust_gen,
+                    sabit_gen,
+                    raf_gen & (tipi == 1),
+                    raf_gen,
+                    altust_fix,
+                    sabit_fix,
+                    raf_fix,
+                    raf_ust_fix,
+                    kayit,
+                ],
+                [
+                    learned_s.fillna('').to_numpy(),
+                    'ARKALIK',
+                    'ARKALIK (İÇERDE)',
+                    'ARKALIK',
+                    'YAN',
+                    'ALT-ÜST',
+                    'SABİT',
+                    'RAF (ÜST)',
+                    'RAF',
+                    'ALT-ÜST',
+                    'SABİT',
+                    'RAF',
+                    'RAF (ÜST)',
+                    'KAYIT/KUŞAK',
+                ],
+                default='DİĞER'
+            )
+
+            # Sonuç frame'i tek seferde - KANALLI bilgisi dahil
+            result_df = pd.DataFrame({
+                'KALINLIK': db_kalinlik,
+                'MALZEME': df['MALZEME'].to_numpy(),
+                'BOY': boy,
+                'EN': en,
+                'PARÇA TİPİ': parca_tipi,
+                'KANALLI': kanalli_arr,  # Kanallı bilgisi eklendi
+                'ADET': df['ADET'].to_numpy(),
+            })
+            
+            # Gruplama - KANALLI bilgisini de dahil et. Tekrarlı metin
+            # sütunları kategorik koda çevrilir; sort=False ile gruplama
+            # sonrası sıralama atlanır (zaten aşağıda sort_values var).
+            result_df['MALZEME'] = result_df['MALZEME'].astype('category')
+            result_df['PARÇA TİPİ'] = result_df['PARÇA TİPİ'].astype('category')
             group_cols = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ', 'KANALLI']
-            summary = result_df.groupby(group_cols).agg({'ADET': 'sum'}).reset_index()
+            summary = result_df.groupby(group_cols, sort=False, observed=True,
+                                        as_index=False)['ADET'].sum()
             
-            # Ayır
-            body_df = summary[summary['KALINLIK'] > ARKALIK_KALINLIK].sort_values(by=['MALZEME', 'KALINLIK', 'PARÇA TİPİ', 'BOY'])
-            thin_df = summary[summary['KALINLIK'] <= ARKALIK_KALINLIK].sort_values(by=['MALZEME', 'PARÇA TİPİ', 'BOY'])
+            # Ayır - kuyruktaki EN/KANALLI anahtarları eşitlik durumunda
+            # eski sıralı gruplamanın verdiği satır sırasını korur
+            body_df = summary[summary['KALINLIK'] > ARKALIK_KALINLIK].sort_values(
+                by=['MALZEME', 'KALINLIK', 'PARÇA TİPİ', 'BOY', 'EN', 'KANALLI'])
+            thin_df = summary[summary['KALINLIK'] <= ARKALIK_KALINLIK].sort_values(
+                by=['MALZEME', 'PARÇA TİPİ', 'BOY', 'KALINLIK', 'EN', 'KANALLI'])
 
             return {
                 'success': True,
@@ -1702,7 +2236,6 @@ class ExcelAnalyzer:
             }
             
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {'success': False, 'error': str(e)}
 
@@ -1711,54 +2244,74 @@ class ExcelAnalyzer:
             return {'success': False, 'error': 'pandas kütüphanesi yüklü değil!'}
 
         try:
-            all_body = []
-            all_thin = []
-
-            for job in jobs:
-                results = job.get('results', {})
-                all_body.extend(results.get('body', []))
-                all_thin.extend(results.get('thin', []))
-
-            if not all_body and not all_thin:
+            # Kayıtlar DataFrame kurulmadan dict anahtarlı toplayıcıda
+            # biriktirilir: anahtar grup sütunlarının demeti, değer ADET
+            # toplamı. Tek geçiş, O(benzersiz grup) bellek; pandas yalnızca
+            # küçük özet frame'i için devreye girer. (Dönüş değeri yine
+            # 'records' listesi: JS tarafı satırları index ile günceller.)
+            base_cols = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ']
+
+            def accumulate(key_name):
+                # Önce hangi isteğe bağlı sütunların kullanıldığı belirlenir
+                # ki anahtar uzunluğu tüm kayıtlar için aynı olsun
+                opt_cols = []
+                for job in jobs:
+                    for rec in job.get('results', {}).get(key_name, []) or []:
+                        for opt in ('MODÜL TİPİ', 'POZ'):
+                            if opt in rec and opt not in opt_cols:
+                                opt_cols.append(opt)
+                group_cols = base_cols + opt_cols
+
+                agg = {}
+                for job in jobs:
+                    for rec in job.get('results', {}).get(key_name, []) or []:
+                        key = tuple(rec.get(c) for c in group_cols)
+                        if any(v is None for v in key):
+                            # Eski groupby gibi: anahtarı eksik satırlar atlanır
+                            continue
+                        agg[key] = agg.get(key, 0) + (rec.get('ADET') or 0)
+                return agg, group_cols
+
+            agg_body, body_cols = accumulate('body')
+            agg_thin, thin_cols = accumulate('thin')
+
+            if not agg_body and not agg_thin:
                 return {'success': False, 'error': 'Birleştirilecek veri bulunamadı'}
 
-            # Combine and group
-            body_df = pd.DataFrame(all_body) if all_body else pd.DataFrame()
-            thin_df = pd.DataFrame(all_thin) if all_thin else pd.DataFrame()
-
-            if not body_df.empty:
-                group_cols = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ']
-                if 'MODÜL TİPİ' in body_df.columns:
-                    group_cols.append('MODÜL TİPİ')
-                if 'POZ' in body_df.columns:
-                    group_cols.append('POZ')
-                body_df = body_df.groupby(group_cols).agg({'ADET': 'sum'}).reset_index()
-                body_df = body_df.sort_values(by=['MALZEME', 'PARÇA TİPİ', 'BOY'])
+            def to_frame(agg, group_cols):
+                if not agg:
+                    return pd.DataFrame()
+                df = pd.DataFrame([(*k, v) for k, v in agg.items()],
+                                  columns=group_cols + ['ADET'])
+                tail_keys = [c for c in group_cols
+                             if c not in ('MALZEME', 'PARÇA TİPİ', 'BOY')]
+                return df.sort_values(by=['MALZEME', 'PARÇA TİPİ', 'BOY'] + tail_keys)
 
-            if not thin_df.empty:
-                group_cols = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ']
-                if 'MODÜL TİPİ' in thin_df.columns:
-                    group_cols.append('MODÜL TİPİ')
-                if 'POZ' in thin_df.columns:
-                    group_cols.append('POZ')
-                thin_df = thin_df.groupby(group_cols).agg({'ADET': 'sum'}).reset_index()
-                thin_df = thin_df.sort_values(by=['MALZEME', 'PARÇA TİPİ', 'BOY'])
+            body_df = to_frame(agg_body, body_cols)
+            thin_df = to_frame(agg_thin, thin_cols)
 
             # Export with formatting
+            from openpyxl.utils import get_column_letter
+
+            def sheet_widths(df):
+                # Sütun başına içerik/başlık uzunluğu, 30 ile sınırlı
+                return [min(max(int(df[col].astype(str).str.len().max()),
+                                len(str(col))) + 2, 30)
+                        for col in df.columns]
+
             with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
                 if not body_df.empty:
                     body_df.to_excel(writer, sheet_name='Gövde', index=False)
                     worksheet = writer.sheets['Gövde']
-                    for idx, col in enumerate(body_df.columns):
-                        max_len = max(body_df[col].astype(str).str.len().max(), len(col)) + 2
-                        worksheet.column_dimensions[chr(65 + idx)].width = min(max_len, 30)
-                        
+                    # get_column_letter: chr(65+idx) 26. sütundan sonra bozulur
+                    for idx, width in enumerate(sheet_widths(body_df)):
+                        worksheet.column_dimensions[get_column_letter(idx + 1)].width = width
+
                 if not thin_df.empty:
                     thin_df.to_excel(writer, sheet_name='İnce', index=False)
                     worksheet = writer.sheets['İnce']
-                    for idx, col in enumerate(thin_df.columns):
-                        max_len = max(thin_df[col].astype(str).str.len().max(), len(col)) + 2
-                        worksheet.column_dimensions[chr(65 + idx)].width = min(max_len, 30)
+                    for idx, width in enumerate(sheet_widths(thin_df)):
+                        worksheet.column_dimensions[get_column_letter(idx + 1)].width = width
 
             total_parts = 0
             if not body_df.empty:
@@ -1774,7 +2327,6 @@ class ExcelAnalyzer:
                 'thin': thin_df.to_dict('records') if not thin_df.empty else []
             }
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {'success': False, 'error': str(e)}
 
@@ -1785,6 +2337,17 @@ class ExcelAnalyzer:
 class Api:
     """JavaScript API interface"""
 
+    # check_file sonuç önbelleği üst sınırı
+    _CHECK_CACHE_SIZE = 64
+
+    # Doğrulanmış session token önbelleği ömrü (saniye)
+    _SESSION_CACHE_TTL = 300
+
+    # Bu satır sayısının üzerindeki analiz sonuçları pywebview köprüsünden
+    # alan alan marshall edilmek yerine tek JSON metni olarak geçirilir;
+    # JS tarafı _json_payload'ı JSON.parse ile açar
+    _JSON_PAYLOAD_ROWS = 2000
+
     def __init__(self):
         self.db = DatabaseManager()
         self.jsondata = JsonDataManager()
@@ -1792,6 +2355,8 @@ class Api:
         self.current_file_paths = []
         self.custom_depths = {}
         self.custom_modules = {}  # POZ -> {genislik, yukseklik, derinlik}
+        self._check_cache: OrderedDict = OrderedDict()
+        self._session_cache: Dict[tuple, tuple] = {}  # (username, token) -> (ts, sonuç)
         
         # Toplu dolap tipi ayarları (Alt/Üst/Boy dolap için varsayılan ölçüler)
         self.cabinet_settings = {
@@ -1814,15 +2379,31 @@ class Api:
     
     def login_with_token(self, username: str, token: str) -> Dict:
         """Token ile otomatik giriş (Beni Hatırla)"""
-        return self.usermgr.verify_session_token(username, token)
-    
+        # Kısa ömürlü önbellek: yeniden bağlanmalarda users.json okuması
+        # ve token karşılaştırması atlanır
+        key = (username, token)
+        cached = self._session_cache.get(key)
+        if cached is not None:
+            ts, result = cached
+            if time.monotonic() - ts < self._SESSION_CACHE_TTL:
+                return result
+            del self._session_cache[key]
+
+        result = self.usermgr.verify_session_token(username, token)
+        if result.get('success'):
+            self._session_cache[key] = (time.monotonic(), result)
+        return result
+
     def check_saved_session(self) -> Dict:
         """Dosyadan kayıtlı oturumu kontrol et ve doğrula"""
         return self.usermgr.load_session_file()
-    
+
     def logout_user(self, username: str) -> Dict:
         """Çıkış yap ve token'ı temizle"""
         self.usermgr.clear_session_token(username)
+        # Kullanıcıya ait önbellekteki doğrulamalar da geçersiz
+        for key in [k for k in self._session_cache if k[0] == username]:
+            del self._session_cache[key]
         return {'success': True}
 
     def add_user(self, username: str, password: str, display_name: str = '', is_admin: bool = False) -> Dict:
@@ -1883,10 +2464,62 @@ class Api:
         return self.db.get_stats()
 
     # === File Operations ===
+    @staticmethod
+    def _check_cache_key(file_path: str):
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return (file_path, st.st_mtime_ns, st.st_size)
+
+    def _probe_check_cache(self, file_path: str):
+        """Önbellekte varsa check_file sonucunu döndür (yoksa None)."""
+        key = self._check_cache_key(file_path)
+        cached = self._check_cache.get(key) if key else None
+        if cached is not None:
+            self._check_cache.move_to_end(key)
+        return cached
+
+    def _store_check_result(self, file_path: str, result: Dict) -> None:
+        key = self._check_cache_key(file_path)
+        if key is None or not result.get('success'):
+            return
+        self._check_cache[key] = result
+        if len(self._check_cache) > self._CHECK_CACHE_SIZE:
+            self._check_cache.popitem(last=False)
+
+    def _with_live_unknown(self, result: Dict) -> Dict:
+        """Önbellekten gelen check sonucuna canlı 'unknown' listesini yaz.
+
+        'unknown' malzeme tablosuna bağlıdır ve save/delete/clear_materials
+        ile oturum içinde değişir; anahtar yalnız dosyayı (yol, mtime, boyut)
+        izlediği için parse türevi alanlar önbellekten gelse de bilinmeyenler
+        her çağrıda güncel tabloya karşı yeniden hesaplanır.
+        """
+        if not result.get('success'):
+            return result
+        known = self.jsondata.get_materials()
+        result = dict(result)  # önbellek girdisi değişmeden kalsın
+        result['unknown'] = [m for m in result.get('materials', []) if m not in known]
+        return result
+
+    def _check_file_cached(self, file_path: str) -> Dict:
+        """check_file sonucunu (yol, mtime, boyut) anahtarıyla önbellekle.
+
+        Aynı dosyalar UI akışlarında (bırak → kontrol → analiz) art arda
+        kontrol edilir; en pahalı adım workbook parse'ıdır. Anahtar mtime
+        içerdiği için dosya değişince girdi kendiliğinden geçersizleşir.
+        """
+        cached = self._probe_check_cache(file_path)
+        if cached is None:
+            cached = self.analyzer.check_file(file_path)
+            self._store_check_result(file_path, cached)
+        return self._with_live_unknown(cached)
+
     def check_file(self, file_path: str) -> Dict:
         """Tek bir dosyayı kontrol et"""
         try:
-            return self.analyzer.check_file(file_path)
+            return self._check_file_cached(file_path)
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
@@ -1899,16 +2532,39 @@ class Api:
                     'error': 'Kontrol edilecek dosya yok'
                 }
 
-            all_unknown = set()
+            # dict.fromkeys: set gibi tekilleştirir ama ekleme sırasını
+            # korur - bilinmeyen malzemeler arayüzde kararlı sırada görünür
+            all_unknown: Dict[str, None] = {}
             total_rows = 0
 
-            for path in self.current_file_paths:
-                check_result = self.analyzer.check_file(path)
+            # Dosya başına workbook parse'ı GIL'i büyük ölçüde C koduna
+            # bıraktığı için kontroller thread havuzunda paralel koşar.
+            # Önbellek erişimi ana thread'de kalır; havuza yalnızca
+            # önbellekte olmayan dosyalar gider, sonuçlar girdi sırasında
+            paths = list(self.current_file_paths)
+            checks = [self._probe_check_cache(p) for p in paths]
+            misses = [i for i, c in enumerate(checks) if c is None]
+            if len(misses) > 1:
+                workers = min(8, os.cpu_count() or 1, len(misses))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    fresh = list(pool.map(self.analyzer.check_file,
+                                          [paths[i] for i in misses]))
+                for i, check_result in zip(misses, fresh):
+                    checks[i] = check_result
+                    self._store_check_result(paths[i], check_result)
+            else:
+                for i in misses:
+                    checks[i] = self._check_file_cached(paths[i])
+
+            # Bilinmeyenler önbellek girdilerinde bayatlayabilir - malzeme
+            # tablosu bir kez okunur, her dosyanın listesi canlı hesaplanır
+            known = self.jsondata.get_materials()
+            for check_result in checks:
                 if not check_result.get('success'):
                     return check_result
 
-                for code in check_result.get('unknown', []):
-                    all_unknown.add(code)
+                all_unknown.update(dict.fromkeys(
+                    m for m in check_result.get('materials', []) if m not in known))
 
                 total_rows += check_result.get('row_count', 0)
 
@@ -1928,32 +2584,47 @@ class Api:
             if not files_data:
                 return {'success': False, 'error': 'Dosya verisi yok'}
 
-            import base64
+            import binascii
             import tempfile
-            
+
+            # base64 4 karakter -> 3 byte; dilim boyu 4'ün katı olmalı.
+            # Tüm içeriği tek seferde çözmek yerine parça parça çözüp
+            # dosyaya akıtmak, base64 metin + çözülmüş byte'ların aynı anda
+            # bellekte durmasını engeller (büyük dosyalarda tepe RSS yarıya iner)
+            B64_CHUNK = 3 * 1024 * 1024 * 4 // 3
+
             self.current_file_paths = []
             temp_dir = tempfile.gettempdir()
 
             for file_item in files_data:
                 name = file_item.get('name', 'unknown.xlsx')
                 content = file_item.get('content') # base64 string
-                
+
                 if not content:
                     continue
-                
+
                 # Basic validation
-                if not name.lower().endswith(('.xlsx', '.xls', '.csv')):
+                if os.path.splitext(name)[1].lower() not in _ALLOWED_EXTS:
                     continue
 
                 # Remove header if present (e.g. "data:application/vnd.ms-excel;base64,")
-                if ',' in content:
-                    content = content.split(',')[1]
-                
-                # Save to temp file
+                # partition ilk virgülde durur, 'in' + split çifte taramasına gerek yok
+                header, sep, payload = content.partition(',')
+                if sep:
+                    content = payload
+
+                # Save to temp file - parça parça base64 çözümü. Ham fd +
+                # os.write: dilimler zaten MB mertebesinde olduğundan
+                # BufferedWriter katmanının kopyalama/arabellek maliyeti
+                # gereksiz, çözülen parça doğrudan dosyaya gider
                 file_path = os.path.join(temp_dir, f"CORE_{name}")
-                with open(file_path, 'wb') as f:
-                    f.write(base64.b64decode(content))
-                
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    for i in range(0, len(content), B64_CHUNK):
+                        os.write(fd, binascii.a2b_base64(content[i:i + B64_CHUNK]))
+                finally:
+                    os.close(fd)
+
                 self.current_file_paths.append(file_path)
 
             if not self.current_file_paths:
@@ -1961,7 +2632,7 @@ class Api:
 
             files_info = []
             for path in self.current_file_paths:
-                check_result = self.analyzer.check_file(path)
+                check_result = self._check_file_cached(path)
                 if check_result['success']:
                     files_info.append({
                         'name': os.path.basename(path),
@@ -1994,7 +2665,7 @@ class Api:
 
             files_info = []
             for path in self.current_file_paths:
-                check_result = self.analyzer.check_file(path)
+                check_result = self._check_file_cached(path)
                 if check_result['success']:
                     files_info.append({
                         'name': os.path.basename(path),
@@ -2014,6 +2685,23 @@ class Api:
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
+    @staticmethod
+    def _pack_large_result(result: Dict) -> Dict:
+        """Büyük sonuçları köprü için tek JSON metnine paketle.
+
+        pywebview dönüş değerini anahtar anahtar Python<->JS köprüsünden
+        geçirir; binlerce satırlık body/thin listelerinde bu marshall
+        maliyeti serileştirmenin kendisini geçer. orjson varsa sonuç tek
+        string olarak döner, V8'in JSON.parse'ı gerisini halleder.
+        """
+        if not ORJSON_AVAILABLE or not result.get('success'):
+            return result
+        rows = len(result.get('body') or ()) + len(result.get('thin') or ())
+        if rows < Api._JSON_PAYLOAD_ROWS:
+            return result
+        return {'success': True,
+                '_json_payload': orjson.dumps(result).decode('utf-8')}
+
     def analyze_and_export(self, file_path: str) -> Dict:
         """Tek dosyayı analiz et ve Excel'e kaydet - tekrar işle için"""
         try:
@@ -2039,7 +2727,7 @@ class Api:
             if result['success']:
                 # Geçmişe ekle
                 job = {
-                    'job_no': result.get('job_no') or f"JOB-{len(self.db.get_history()) + 1:04d}",
+                    'job_no': result.get('job_no') or f"JOB-{self.db.get_history_count() + 1:04d}",
                     'date': datetime.now().strftime("%Y-%m-%d %H:%M"),
                     'file_name': os.path.basename(file_path),
                     'file_path': file_path,
@@ -2055,8 +2743,8 @@ class Api:
                     }
                 }
                 self.db.add_history(job)
-            
-            return result
+
+            return self._pack_large_result(result)
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
@@ -2073,8 +2761,8 @@ class Api:
             
             # Analiz et ama Excel'e kaydetme - sadece sonuçları döndür
             result = self.analyzer.analyze_only(path, self.custom_depths)
-            
-            return result
+
+            return self._pack_large_result(result)
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
@@ -2094,17 +2782,37 @@ class Api:
             results = []
             errors = []
 
-            for path in self.current_file_paths:
+            # Çıktı yolları önce belirlenir, analizler thread havuzunda
+            # paralel koşar (parse/yazma ağırlıklı, GIL çoğunlukla serbest).
+            # Geçmişe yazma SQLite yüzünden ana thread'de ve sıralı kalır.
+            paths = list(self.current_file_paths)
+            output_paths = []
+            for path in paths:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 base_name = os.path.splitext(os.path.basename(path))[0]
-                output_path = os.path.join(output_dir, f"{base_name}_{timestamp}.xlsx")
+                output_paths.append(os.path.join(output_dir, f"{base_name}_{timestamp}.xlsx"))
+
+            if len(paths) > 1:
+                workers = min(8, os.cpu_count() or 1, len(paths))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    analyze_results = list(pool.map(
+                        lambda args: self.analyzer.analyze_and_export(args[0], args[1], self.custom_depths),
+                        zip(paths, output_paths)))
+            else:
+                analyze_results = [self.analyzer.analyze_and_export(p, o, self.custom_depths)
+                                   for p, o in zip(paths, output_paths)]
 
-                result = self.analyzer.analyze_and_export(path, output_path, self.custom_depths)
+            # Fallback iş numaraları için sayım bir kez alınır; döngü içinde
+            # her dosyada tüm geçmişi çekmeye gerek yok
+            base_count = self.db.get_history_count()
+            added = 0
+            pending_jobs = []
 
+            for path, output_path, result in zip(paths, output_paths, analyze_results):
                 if result['success']:
                     # Add to history
                     job = {
-                        'job_no': result.get('job_no') or f"JOB-{len(self.db.get_history()) + 1:04d}",
+                        'job_no': result.get('job_no') or f"JOB-{base_count + added + 1:04d}",
                         'date': datetime.now().strftime("%Y-%m-%d %H:%M"),
                         'file_name': os.path.basename(path),
                         'file_path': path,
@@ -2119,11 +2827,15 @@ class Api:
                             'thin': result['thin']
                         }
                     }
-                    self.db.add_history(job)
+                    pending_jobs.append(job)
+                    added += 1
                     results.append({'file': os.path.basename(path), 'output': output_path, 'parts': result['total_parts']})
                 else:
                     errors.append({'file': os.path.basename(path), 'error': result.get('error', 'Bilinmeyen hata')})
 
+            # Tüm işler tek transaction'da yazılır
+            self.db.add_history_bulk(pending_jobs)
+
             return {
                 'success': len(errors) == 0,
                 'results': results,
@@ -2162,17 +2874,22 @@ class Api:
     def open_file(self, file_path: str) -> Dict:
         """Open file with default application"""
         try:
-            if not os.path.exists(file_path):
-                return {'success': False, 'error': 'Dosya bulunamadı'}
-
+            # Ön exists() kontrolü yok - başarılı yolda fazladan stat
+            # yapmamak için hata sadece başlatıcı başarısız olursa incelenir
             if platform.system() == 'Windows':
                 os.startfile(file_path)
             elif platform.system() == 'Darwin':
-                subprocess.run(['open', file_path])
+                failed = subprocess.run(['open', file_path]).returncode != 0
+                if failed and not os.path.exists(file_path):
+                    return {'success': False, 'error': 'Dosya bulunamadı'}
             else:
-                subprocess.run(['xdg-open', file_path])
+                failed = subprocess.run(['xdg-open', file_path]).returncode != 0
+                if failed and not os.path.exists(file_path):
+                    return {'success': False, 'error': 'Dosya bulunamadı'}
 
             return {'success': True}
+        except FileNotFoundError:
+            return {'success': False, 'error': 'Dosya bulunamadı'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
@@ -2198,12 +2915,38 @@ class Api:
                 'created_at': datetime.now().isoformat(),
                 'settings': self.jsondata.get_settings(),
                 'materials': self.jsondata.get_materials(),
-                'learned_parts': self.jsondata.get_learned_parts(),
-                'history': self.db.get_history(1000)
+                'learned_parts': self.jsondata.get_learned_parts()
             }
 
+            # orjson doğrudan byte üretir ve stdlib'in saf-Python
+            # pretty-print yolundan kat kat hızlıdır; çıktı yine girintili
+            # UTF-8 JSON olduğundan eski yedeklerle biçim uyumlu kalır
+            if ORJSON_AVAILABLE:
+                def dumps(obj):
+                    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+            else:
+                def dumps(obj):
+                    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+            # Geçmişin body/thin blokları SQLite'ta zaten JSON metni;
+            # json.loads + json.dumps gidiş-dönüşü yerine ham metin olduğu
+            # gibi satır JSON'una eklenir (yedeğin en büyük kısmı burası)
+            history_parts = []
+            for row in self.db.get_history_raw(1000):
+                body_json = row.pop('body_json')
+                thin_json = row.pop('thin_json')
+                row_txt = dumps(row)
+                history_parts.append(
+                    row_txt[:row_txt.rfind('}')]
+                    + ', "results": {"body": ' + body_json
+                    + ', "thin": ' + thin_json + '}}')
+
+            head_txt = dumps(data)
+            backup_txt = (head_txt[:head_txt.rfind('}')]
+                          + ', "history": [' + ', '.join(history_parts) + ']}')
+
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.write(backup_txt)
 
             return {'success': True, 'path': output_path}
         except Exception as e:
@@ -2221,15 +2964,19 @@ class Api:
 
             backup_path = result[0] if isinstance(result, tuple) else result
 
-            with open(backup_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(backup_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(backup_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
 
             if 'settings' in data:
                 self.jsondata.save_settings(data['settings'])
             if 'materials' in data:
                 self.jsondata.save_all_materials(data['materials'])
             if 'learned_parts' in data:
-                self.jsondata._write_json('learned_parts', data['learned_parts'])
+                self.jsondata.restore_learned_parts(data['learned_parts'])
 
             return {'success': True}
         except Exception as e:
@@ -2261,9 +3008,12 @@ class Api:
         try:
             if not PANDAS_AVAILABLE:
                 return {'success': False, 'error': 'pandas yüklü değil'}
-            
-            df = pd.read_excel(file_path)
-            
+
+            # Analizörün read-only akış okuyucusu + LRU'su üzerinden:
+            # stil/tip makinesine girmeden hücre değerleri okunur ve aynı
+            # dosya analiz akışında tekrar parse edilmez
+            df = self.analyzer._read_frame_cached(file_path)
+
             modules = {}
             
             # Info4 (POZ) ve Info5 (Modül adı) sütunlarını bul - hem §542 hem #8542
@@ -2282,41 +3032,36 @@ class Api:
             if not poz_col or not modul_col:
                 return {'success': False, 'error': 'Dosyada modül bilgisi bulunamadı (Info4/Info5 sütunları yok)'}
             
-            for idx, row in df.iterrows():
-                poz = str(row.get(poz_col, '')).strip()
-                modul_adi = str(row.get(modul_col, '')).strip()
-                
-                if not poz or poz == 'nan' or poz in modules:
-                    continue
-                
-                # Modül tipini belirle
-                modul_lower = modul_adi.lower()
-                if 'üst' in modul_lower or 'ust' in modul_lower:
-                    tip = 'ust'
-                    varsayilan_derinlik = 330
-                elif 'boy' in modul_lower:
-                    tip = 'boy'
-                    varsayilan_derinlik = 580
-                else:
-                    tip = 'alt'
-                    varsayilan_derinlik = 580
-                
-                # Genişlik - modül adından çıkar
-                cm_match = re.search(r'(\d+)\s*cm', modul_adi)
-                genislik_cm = int(cm_match.group(1)) if cm_match else None
-                
+            # Satır döngüsü yerine kolon bazlı hazırlık: POZ başına ilk
+            # satır alınır, tip ve cm genişliği tüm sütun için tek geçişte
+            # çıkarılır; Python döngüsü yalnız benzersiz POZ'lar üzerinde döner
+            # (str dtype astype(str) NaN'ı korur; eski str(nan) davranışına
+            # denk gelsin diye boşlar 'nan' ile doldurulur)
+            s_poz = df[poz_col].astype(str).fillna('nan').str.strip()
+            s_mod = df[modul_col].astype(str).fillna('nan').str.strip()
+            first = s_poz.ne('') & s_poz.ne('nan') & ~s_poz.duplicated()
+            s_poz = s_poz[first]
+            s_mod = s_mod[first]
+
+            folded = s_mod.str.translate(TR_FOLD).str.lower()
+            tips = np.where(folded.str.contains('ust', regex=False), 'ust',
+                            np.where(folded.str.contains('boy', regex=False), 'boy', 'alt'))
+            gens = pd.to_numeric(s_mod.str.extract(_CM_RE, expand=False),
+                                 errors='coerce')
+
+            for poz, modul_adi, tip, genislik in zip(
+                    s_poz.tolist(), s_mod.tolist(), tips.tolist(), gens):
                 modules[poz] = {
                     'ad': modul_adi,
                     'tip': tip,
-                    'genislik_cm': genislik_cm,
-                    'varsayilan_derinlik': varsayilan_derinlik,
+                    'genislik_cm': int(genislik) if pd.notna(genislik) else None,
+                    'varsayilan_derinlik': 330 if tip == 'ust' else 580,
                     'ozel_derinlik': self.custom_depths.get(poz)
                 }
             
             print(f"Found {len(modules)} modules")
             return {'success': True, 'modules': modules}
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {'success': False, 'error': str(e)}
     
@@ -2411,49 +3156,44 @@ class Api:
             # DataFrame'lere dönüştür
             all_data_df = pd.DataFrame(body_data + thin_data) if (body_data or thin_data) else pd.DataFrame()
             
-            # Kanallı parçaların tipine (K) ekle
+            # Kanallı parçaların tipine (K) ekle - satır başına apply yerine
+            # tek vektörel np.where
             def add_kanalli_to_type(df):
                 if df.empty:
                     return df
                 if 'KANALLI' in df.columns and 'PARÇA TİPİ' in df.columns:
-                    df['PARÇA TİPİ'] = df.apply(
-                        lambda row: f"{row['PARÇA TİPİ']} (K)" if row.get('KANALLI', False) else row['PARÇA TİPİ'],
-                        axis=1
+                    kanalli = df['KANALLI'].fillna(False).astype(bool)
+                    df['PARÇA TİPİ'] = np.where(
+                        kanalli,
+                        df['PARÇA TİPİ'].astype(str) + ' (K)',
+                        df['PARÇA TİPİ']
                     )
                 return df
             
             all_data_df = add_kanalli_to_type(all_data_df)
             
-            # Kalınlığa göre 3 tabloya ayır
+            # Kalınlığa göre 3 tabloya ayır - üç ayrı maske taraması yerine
+            # tek geçişli etiket + groupby; aralık dışı kalınlıklar eskisi
+            # gibi hiçbir tabloya düşmez
             if not all_data_df.empty and 'KALINLIK' in all_data_df.columns:
-                df_18mm = all_data_df[all_data_df['KALINLIK'] == 18].copy()
-                df_16mm = all_data_df[all_data_df['KALINLIK'] == 16].copy()
-                df_8mm = all_data_df[all_data_df['KALINLIK'] <= 8].copy()
+                kal = all_data_df['KALINLIK'].to_numpy()
+                bucket = np.select([kal == 18, kal == 16, kal <= 8],
+                                   ['18mm', '16mm', '8mm'], default='')
+                groups = {k: g for k, g in all_data_df.groupby(bucket, sort=False)}
+                df_18mm = groups.get('18mm', pd.DataFrame())
+                df_16mm = groups.get('16mm', pd.DataFrame())
+                df_8mm = groups.get('8mm', pd.DataFrame())
             else:
                 df_18mm = pd.DataFrame()
                 df_16mm = pd.DataFrame()
                 df_8mm = pd.DataFrame()
             
-            # PARÇA TİPİ'ne göre sırala - aynı tipler alt alta gelsin
-            part_type_order = [
-                'YAN', 'YAN (K)',
-                'ALT-ÜST', 'ALT-ÜST (K)',
-                'SABİT', 'SABİT (K)',
-                'RAF', 'RAF (K)',
-                'RAF (ÜST)', 'RAF (ÜST) (K)',
-                'KAYIT/KUŞAK', 'KAYIT/KUŞAK (K)',
-                'ÇEKMECE YANI', 'ÇEKMECE YANI (K)',
-                'ARKALIK', 'ARKALIK (K)',
-                'ARKALIK (İÇERDE)', 'ARKALIK (İÇERDE) (K)',
-                'DİĞER', 'DİĞER (K)'
-            ]
-            
+            # PARÇA TİPİ'ne göre sırala - sıralama listesi ve rank sözlüğü
+            # modül seviyesinde bir kez kuruluyor (PART_TYPE_ORDER / _PART_TYPE_RANK)
             def sort_by_part_type(df):
                 if df.empty or 'PARÇA TİPİ' not in df.columns:
                     return df
-                df['_sort_order'] = df['PARÇA TİPİ'].apply(
-                    lambda x: part_type_order.index(x) if x in part_type_order else 999
-                )
+                df['_sort_order'] = df['PARÇA TİPİ'].map(_PART_TYPE_RANK).fillna(999).astype('int16')
                 df = df.sort_values(by=['_sort_order', 'MALZEME', 'BOY', 'EN'])
                 df = df.drop(columns=['_sort_order'])
                 return df
@@ -2462,136 +3202,140 @@ class Api:
             df_16mm = sort_by_part_type(df_16mm)
             df_8mm = sort_by_part_type(df_8mm)
             
-            # Excel'e yaz - TEK SHEET'TE 3 TABLO YAN YANA
-            from openpyxl import Workbook
-            from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-            from openpyxl.utils import get_column_letter
-            
-            workbook = Workbook()
-            worksheet = workbook.active
-            worksheet.title = 'Kesim Listesi'
-            
-            # Stil tanımları - 3 farklı renk
-            header_font = Font(bold=True, color='FFFFFF')
-            header_fill_18mm = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')  # Mavi
-            header_fill_16mm = PatternFill(start_color='8B5CF6', end_color='8B5CF6', fill_type='solid')  # Mor
-            header_fill_8mm = PatternFill(start_color='70AD47', end_color='70AD47', fill_type='solid')   # Yeşil
-            title_font = Font(bold=True, size=14)
-            thin_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
             # KANALLI sütununu çıkar (artık parça tipine eklendi)
             for df in [df_18mm, df_16mm, df_8mm]:
                 if not df.empty and 'KANALLI' in df.columns:
                     df.drop(columns=['KANALLI'], inplace=True)
-            
-            # Sütun sıralaması
-            column_order = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ', 'ADET']
-            cols_count = 6
-            table_gap = 1  # Tablolar arası boşluk
-            
-            def write_table(ws, start_col, df, title, header_fill):
-                """Tek bir tabloyu belirtilen sütundan başlayarak yaz"""
-                current_row = 1
-                
-                # Zebra efekti için gri renk
-                gray_fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
-                
-                # Başlık - ORTALI
-                ws.cell(row=current_row, column=start_col, value=title)
-                ws.cell(row=current_row, column=start_col).font = title_font
-                ws.cell(row=current_row, column=start_col).alignment = Alignment(horizontal='center')
-                if cols_count > 1:
-                    ws.merge_cells(start_row=current_row, start_column=start_col, 
-                                  end_row=current_row, end_column=start_col + cols_count - 1)
-                
-                current_row += 1
-                
-                # Header satırı
-                header_names = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ', 'ADET']
-                for col_idx, col_name in enumerate(header_names):
-                    cell = ws.cell(row=current_row, column=start_col + col_idx, value=col_name)
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.alignment = Alignment(horizontal='center')
-                    cell.border = thin_border
-                
-                current_row += 1
-                
-                # Veri satırları - ZEBRA EFEKTİ (beyaz/gri)
-                if not df.empty:
-                    df_ordered = df.copy()
-                    existing_cols = [c for c in column_order if c in df_ordered.columns]
-                    df_ordered = df_ordered[existing_cols]
-                    
-                    row_index = 0
-                    for row_data in df_ordered.values:
-                        for col_idx, value in enumerate(row_data):
-                            cell = ws.cell(row=current_row, column=start_col + col_idx, value=value)
-                            cell.border = thin_border
-                            cell.alignment = Alignment(horizontal='center')
-                            # Çift satırlar gri (0, 2, 4...), tek satırlar beyaz
-                            if row_index % 2 == 1:
-                                cell.fill = gray_fill
-                        current_row += 1
-                        row_index += 1
-                else:
-                    ws.cell(row=current_row, column=start_col, value='(Veri yok)')
-                    current_row += 1
-                
-                return current_row
-            
-            # ========== 1. TABLO: 18mm PARÇALAR (Mavi) ==========
-            col_18mm_start = 1
-            write_table(worksheet, col_18mm_start, df_18mm, '18mm Parçalar', header_fill_18mm)
-            
-            # ========== 2. TABLO: 16mm PARÇALAR (Mor) ==========
-            col_16mm_start = col_18mm_start + cols_count + table_gap
-            write_table(worksheet, col_16mm_start, df_16mm, '16mm Parçalar', header_fill_16mm)
-            
-            # ========== 3. TABLO: 8mm PARÇALAR (Yeşil) ==========
-            col_8mm_start = col_16mm_start + cols_count + table_gap
-            write_table(worksheet, col_8mm_start, df_8mm, '8mm Parçalar', header_fill_8mm)
-            
-            # Sütun genişliklerini ayarla
-            # Sütun sırası: KALINLIK, MALZEME, BOY, EN, PARÇA TİPİ, ADET
-            # 18mm ve 16mm için genişlikler
-            widths_normal = [9, None, 9.5, 9.5, 14.2, 9]  # None = otomatik
-            # 8mm için genişlikler (PARÇA TİPİ farklı)
-            widths_8mm = [9, None, 9.5, 9.5, 15.7, 9]
-            
-            def set_column_widths(start_col, df, widths):
-                for i, width in enumerate(widths):
-                    col_letter = get_column_letter(start_col + i)
-                    if width is None:
-                        # Otomatik: içeriğe göre ayarla
-                        max_len = len('MALZEME')  # Header uzunluğu
-                        if not df.empty and 'MALZEME' in df.columns:
-                            max_content = df['MALZEME'].astype(str).str.len().max()
-                            max_len = max(max_len, max_content)
-                        worksheet.column_dimensions[col_letter].width = max_len + 2
+
+            # Excel'e yaz - TEK SHEET'TE 3 TABLO YAN YANA. Düzen özet
+            # exportuyla aynı olduğundan xlsxwriter kuruluysa aynı
+            # constant_memory yazıcısı kullanılır, yoksa write-only openpyxl
+            if XLSXWRITER_AVAILABLE:
+                _export_summary_xlsxwriter(output_path, df_18mm, df_16mm, df_8mm)
+            else:
+                from openpyxl import Workbook
+                from openpyxl.cell import WriteOnlyCell
+                from openpyxl.utils import get_column_letter
+
+                workbook = Workbook(write_only=True)
+                worksheet = workbook.create_sheet('Kesim Listesi')
+
+                # Stil tanımları - modül genelinde bir kez kurulup paylaşılır
+                styles = _get_xlsx_styles()
+                header_font = styles['header_font']
+                title_font = styles['title_font']
+                thin_border = styles['thin_border']
+                center = styles['center']
+                # Zebra efekti veri hücrelerinde NamedStyle ile (tek atama)
+                workbook.add_named_style(styles['plain_data_style'])
+                workbook.add_named_style(styles['zebra_data_style'])
+
+                # Sütun sıralaması ve yerleşim
+                column_order = ['KALINLIK', 'MALZEME', 'BOY', 'EN', 'PARÇA TİPİ', 'ADET']
+                cols_count = 6
+                table_gap = 1  # Tablolar arası boşluk
+
+                col_18mm_start = 1
+                col_16mm_start = col_18mm_start + cols_count + table_gap
+                col_8mm_start = col_16mm_start + cols_count + table_gap
+
+                tables = []
+                for start_col, df, title, hdr_fill in (
+                        (col_18mm_start, df_18mm, '18mm Parçalar', styles['header_fill_18mm']),
+                        (col_16mm_start, df_16mm, '16mm Parçalar', styles['header_fill_16mm']),
+                        (col_8mm_start, df_8mm, '8mm Parçalar', styles['header_fill_8mm'])):
+                    if not df.empty:
+                        existing_cols = [c for c in column_order if c in df.columns]
+                        data_rows = list(df[existing_cols].itertuples(index=False, name=None))
                     else:
-                        worksheet.column_dimensions[col_letter].width = width
-            
-            set_column_widths(col_18mm_start, df_18mm, widths_normal)
-            set_column_widths(col_16mm_start, df_16mm, widths_normal)
-            set_column_widths(col_8mm_start, df_8mm, widths_8mm)
-            
-            # Toplam parça sayısı hesapla
-            total_parts = 0
-            if not df_18mm.empty and 'ADET' in df_18mm.columns:
-                total_parts += int(df_18mm['ADET'].sum())
-            if not df_16mm.empty and 'ADET' in df_16mm.columns:
-                total_parts += int(df_16mm['ADET'].sum())
-            if not df_8mm.empty and 'ADET' in df_8mm.columns:
-                total_parts += int(df_8mm['ADET'].sum())
-            
-            # Excel dosyasını kaydet
-            workbook.save(output_path)
+                        data_rows = []
+                    tables.append((start_col, data_rows, title, hdr_fill))
+
+                # Sütun genişlikleri - write-only modda satırlar eklenmeden önce
+                # Sütun sırası: KALINLIK, MALZEME, BOY, EN, PARÇA TİPİ, ADET
+                widths_normal = [9, None, 9.5, 9.5, 14.2, 9]  # None = otomatik
+                # 8mm için genişlikler (PARÇA TİPİ farklı)
+                widths_8mm = [9, None, 9.5, 9.5, 15.7, 9]
+
+                def malzeme_max_len(df):
+                    # Benzersiz değerler üzerinden O(#unique) - tüm sütunu
+                    # stringe çevirip taramaktan kaçınır
+                    max_len = len('MALZEME')  # Header uzunluğu
+                    if not df.empty and 'MALZEME' in df.columns:
+                        uniq = pd.Index(df['MALZEME'].unique()).astype(str)
+                        if len(uniq):
+                            max_len = max(max_len, int(uniq.str.len().max()))
+                    return max_len
+
+                def set_column_widths(start_col, widths, auto_len):
+                    for i, width in enumerate(widths):
+                        col_letter = get_column_letter(start_col + i)
+                        if width is None:
+                            # Otomatik: önceden hesaplanan içerik uzunluğu
+                            worksheet.column_dimensions[col_letter].width = auto_len + 2
+                        else:
+                            worksheet.column_dimensions[col_letter].width = width
+
+                set_column_widths(col_18mm_start, widths_normal, malzeme_max_len(df_18mm))
+                set_column_widths(col_16mm_start, widths_normal, malzeme_max_len(df_16mm))
+                set_column_widths(col_8mm_start, widths_8mm, malzeme_max_len(df_8mm))
+
+                # Başlık satırı - ORTALI, tablo genişliğince birleştirilmiş
+                title_row = []
+                for start_col, data_rows, title, hdr_fill in tables:
+                    cell = WriteOnlyCell(worksheet, value=title)
+                    cell.font = title_font
+                    cell.alignment = center
+                    title_row.extend([cell] + [None] * (cols_count + table_gap - 1))
+                    worksheet.merged_cells.ranges.add(
+                        f'{get_column_letter(start_col)}1:{get_column_letter(start_col + cols_count - 1)}1')
+                worksheet.append(title_row[:-table_gap])
+
+                # Header satırı
+                header_row = []
+                for start_col, data_rows, title, hdr_fill in tables:
+                    for name in column_order:
+                        cell = WriteOnlyCell(worksheet, value=name)
+                        cell.font = header_font
+                        cell.fill = hdr_fill
+                        cell.alignment = center
+                        cell.border = thin_border
+                        header_row.append(cell)
+                    header_row.append(None)
+                worksheet.append(header_row[:-1])
+
+                # Veri satırları - ZEBRA EFEKTİ (beyaz/gri), üç tablo tek satır
+                # akışında; en az bir tur dönülür ki boş tablolara '(Veri yok)'
+                # yazılsın
+                max_rows = max(1, *(len(rows) for _, rows, _, _ in tables))
+                for r in range(max_rows):
+                    data_style = 'zebra_data' if r % 2 == 1 else 'plain_data'
+                    out = []
+                    for start_col, data_rows, _, _ in tables:
+                        if r < len(data_rows):
+                            values = data_rows[r]
+                            for value in values:
+                                cell = WriteOnlyCell(worksheet, value=value)
+                                cell.style = data_style
+                                out.append(cell)
+                            out.extend([None] * (cols_count - len(values)))
+                        elif r == 0:
+                            out.append(WriteOnlyCell(worksheet, value='(Veri yok)'))
+                            out.extend([None] * (cols_count - 1))
+                        else:
+                            out.extend([None] * cols_count)
+                        out.append(None)
+                    worksheet.append(out[:-1])
+
+                # Excel dosyasını kaydet
+                workbook.save(output_path)
+
+            # Toplam parça sayısı - üç ayrı pandas sum yerine tek numpy
+            # indirgemesi
+            adet_arrays = [d['ADET'].to_numpy()
+                           for d in (df_18mm, df_16mm, df_8mm)
+                           if not d.empty and 'ADET' in d.columns]
+            total_parts = int(np.concatenate(adet_arrays).sum()) if adet_arrays else 0
             
             # History'ye ekle
             if self.current_file_paths:
@@ -2601,26 +3345,27 @@ class Api:
                 file_path = ''
                 file_name = 'Manuel Düzenleme'
             
-            # Tüm malzemeleri topla
-            all_materials = set()
-            all_types = set()
-            for df in [df_18mm, df_16mm, df_8mm]:
-                if not df.empty:
-                    if 'MALZEME' in df.columns:
-                        all_materials.update(df['MALZEME'].tolist())
-                    if 'PARÇA TİPİ' in df.columns:
-                        all_types.update(df['PARÇA TİPİ'].tolist())
+            # Benzersiz malzeme/tip sayıları - satır satır set.update yerine
+            # C tarafında tek pd.unique geçişi
+            def unique_count(col):
+                arrays = [d[col].to_numpy()
+                          for d in (df_18mm, df_16mm, df_8mm)
+                          if not d.empty and col in d.columns]
+                return len(pd.unique(np.concatenate(arrays))) if arrays else 0
+
+            n_materials = unique_count('MALZEME')
+            n_types = unique_count('PARÇA TİPİ')
             
             job = {
-                'job_no': job_no or f"JOB-{len(self.db.get_history()) + 1:04d}",
+                'job_no': job_no or f"JOB-{self.db.get_history_count() + 1:04d}",
                 'date': datetime.now().strftime("%Y-%m-%d %H:%M"),
                 'file_name': file_name,
                 'file_path': file_path,
                 'output_path': output_path,
                 'stats': {
                     'parts': total_parts,
-                    'materials': len(all_materials),
-                    'types': len(all_types)
+                    'materials': n_materials,
+                    'types': n_types
                 },
                 'results': {
                     'body': body_data,
@@ -2636,7 +3381,6 @@ class Api:
             }
             
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {'success': False, 'error': str(e)}
 
@@ -2669,24 +3413,40 @@ class Api:
             # Body ve thin verilerini filtrele
             body_data = result.get('body', [])
             thin_data = result.get('thin', [])
-            
-            # Sadece seçilen tipleri tut
-            filtered_body = [row for row in body_data if row.get('PARÇA TİPİ') in selected_types]
-            filtered_thin = [row for row in thin_data if row.get('PARÇA TİPİ') in selected_types]
-            
-            # Filtrelenmiş sonuçlarla export et
+
+            # Sadece seçilen tipleri tut - satır başına Python dict erişimi
+            # yerine tek DataFrame + isin/sum (numpy çekirdekleri)
+            sel = frozenset(selected_types)
+            body_df = pd.DataFrame(body_data)
+            thin_df = pd.DataFrame(thin_data)
+            total_parts = 0
+            if not body_df.empty:
+                body_df = body_df[body_df['PARÇA TİPİ'].isin(sel)]
+                total_parts += int(body_df['ADET'].sum())
+            if not thin_df.empty:
+                thin_df = thin_df[thin_df['PARÇA TİPİ'].isin(sel)]
+                total_parts += int(thin_df['ADET'].sum())
+
+            # Dict'e dönüş sadece export sınırında - kaynak listeler workbook
+            # kurulmadan önce bırakılır, büyük işlerde veri iki kez tutulmaz
             job_no = result.get('job_no', '')
+            result['body'] = result['thin'] = None
+            del body_data, thin_data
+            filtered_body = body_df.to_dict('records') if not body_df.empty else []
+            filtered_thin = thin_df.to_dict('records') if not thin_df.empty else []
+            del body_df, thin_df
+
+            # Filtrelenmiş sonuçlarla export et
             export_result = self.export_edited_results(filtered_body, filtered_thin, job_no)
-            
+
             if export_result.get('success'):
                 export_result['filtered'] = True
                 export_result['selected_types'] = selected_types
-                export_result['total_parts'] = sum(row.get('ADET', 0) for row in filtered_body + filtered_thin)
+                export_result['total_parts'] = total_parts
             
             return export_result
             
         except Exception as e:
-            import traceback
             traceback.print_exc()
             return {'success': False, 'error': str(e)}
 
@@ -2697,27 +3457,32 @@ class Api:
 def main():
     """Main entry point"""
     print(f"Starting {Config.APP_TITLE}...")
-    print(f"Base path: {Config.get_base_path()}")
-    print(f"App dir: {Config.get_app_dir()}")
-    print(f"Data dir: {Config.get_data_dir()}")
+    if DEBUG:
+        print(f"Base path: {Config.get_base_path()}")
+        print(f"App dir: {Config.get_app_dir()}")
+        print(f"Data dir: {Config.get_data_dir()}")
 
-    # Check for index.html
+    # Check for index.html - mutlu yolda tek stat çağrısı
     html_path = Config.get_html_path()
-    print(f"HTML path: {html_path}")
+    if DEBUG:
+        print(f"HTML path: {html_path}")
 
     if not html_path.exists():
         print(f"ERROR: index.html not found at {html_path}")
-        # Try alternative paths
-        alt_paths = [
+        # Try alternative paths (sadece birincil yol yoksa taranır;
+        # frozen exe'de cwd yavaş bir ağ sürücüsü olabilir)
+        alt_paths = (
             get_app_dir() / "index.html",
             Path(__file__).parent / "index.html",
             Path.cwd() / "index.html"
-        ]
+        )
         for alt in alt_paths:
-            print(f"Trying: {alt}")
+            if DEBUG:
+                print(f"Trying: {alt}")
             if alt.exists():
                 html_path = alt
-                print(f"Found at: {html_path}")
+                if DEBUG:
+                    print(f"Found at: {html_path}")
                 break
         else:
             print("ERROR: Could not find index.html anywhere!")
@@ -2739,10 +3504,20 @@ def main():
         confirm_close=True
     )
 
-    print("Window created, starting webview...")
+    if DEBUG:
+        print("Window created, starting webview...")
 
-    # Start webview (debug=False for production)
-    webview.start(debug=False)
+    # Gereksiz IPC dinleyicilerini kapat
+    webview.settings['ALLOW_DOWNLOADS'] = False
+    webview.settings['OPEN_DEVTOOLS_IN_DEBUG'] = False
+
+    # Start webview (debug sadece CORE_DEBUG ile; production'da devtools
+    # köprüsü her JS->Python çağrısına gecikme ekliyor)
+    webview.start(
+        debug=DEBUG,
+        gui='edgechromium' if sys.platform == 'win32' else None,
+        http_server=False
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
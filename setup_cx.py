@@ -11,6 +11,7 @@ build_exe_options = {
         "pandas",
         "openpyxl",
         "bcrypt",
+        "orjson",
         "sqlite3",
         "json",
         "pathlib",
@@ -25,7 +26,23 @@ build_exe_options = {
         "webview.platforms.winforms",
         "webview.platforms.edgechromium",
     ],
-    "excludes": ["tkinter", "matplotlib", "scipy", "numpy.random._examples"],
+    # Test paketleri, yardımcı araçlar ve kullanılmayan alt modüller imaja
+    # girmesin - hem boyut hem soğuk başlangıçta binlerce stat çağrısı
+    "excludes": [
+        "tkinter",
+        "matplotlib",
+        "scipy",
+        "numpy.random._examples",
+        "numpy.tests",
+        "numpy.f2py",
+        "pandas.tests",
+        "pandas._testing",
+        "pandas.io.clipboard",
+        "openpyxl.tests",
+    ],
+    # Saf-Python büyük paketler tek zip'ten yüklensin: açılışta binlerce
+    # ayrı dosya stat/open yerine tek mmap
+    "zip_include_packages": ["pandas", "numpy", "openpyxl", "dateutil", "pytz"],
     "include_files": [
         ("index.html", "index.html"),
         ("CORE_LOGO.png", "CORE_LOGO.png"),